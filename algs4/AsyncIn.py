@@ -0,0 +1,275 @@
+"""
+The AsyncIn class is an asyncio version of In for reading strings and numbers from URLs.
+
+The response body is read in chunks as it arrives and split into tokens incrementally, so many inputs
+can be downloaded and parsed concurrently on one event loop, and memory use does not grow with the
+size of the body. Tokens are split on ASCII whitespace.
+
+::
+
+    async def main(urls):
+        inputs = await asyncio.gather(*(AsyncIn.open(url) for url in urls))
+        for inp in inputs:
+            V = await inp.readInt()
+            async for batch in inp.doubleBatches():
+                ...
+
+Only http and https URLs are supported. The request is a plain HTTP/1.1 GET; the response must have
+status 200, and may be delimited by Content-Length, chunked transfer encoding, or the end of the
+connection.
+"""
+
+import asyncio
+import collections
+import urllib.parse
+from array import array
+
+from In import InputMismatchException, NoSuchElementException, _split_chunk
+
+
+class AsyncIn:
+
+    # assume Unicode UTF-8 encoding
+    CHARSET_NAME = "utf-8"
+
+    # number of bytes read from the connection at a time
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, reader, writer, headers, chunk_size=CHUNK_SIZE):
+        """Initializes an input stream over an HTTP response whose status line and headers have been read.
+        Use AsyncIn.open to create one.
+
+        :param reader: the asyncio.StreamReader of the connection.
+        :param writer: the asyncio.StreamWriter of the connection.
+        :param headers: the response headers, with lower case names.
+        :param chunk_size: number of bytes read from the connection at a time.
+        """
+        self.reader = reader
+        self.writer = writer
+        self.headers = headers
+        self._chunks = self._body(chunk_size)
+        self._tokens = collections.deque()
+        self._carry = None
+        self._done = False
+
+    @classmethod
+    async def open(cls, url, chunk_size=CHUNK_SIZE):
+        """Connects to the given URL, sends the request, and reads the response headers.
+
+        @throws ValueError if the URL is not an http or https URL
+        @throws IOError if the response status is not 200
+        :param url: URL to read from.
+        :param chunk_size: number of bytes read from the connection at a time.
+        :return: the input stream over the response body.
+        """
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError("unsupported URL scheme: " + url)
+        use_ssl = parts.scheme == "https"
+        port = parts.port or (443 if use_ssl else 80)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        reader, writer = await asyncio.open_connection(parts.hostname, port, ssl=use_ssl or None)
+        request = ("GET " + path + " HTTP/1.1\r\n"
+                   + "Host: " + parts.netloc + "\r\n"
+                   + "Accept-Encoding: identity\r\n"
+                   + "Connection: close\r\n\r\n")
+        writer.write(request.encode("ascii"))
+        await writer.drain()
+
+        status = (await reader.readline()).decode("latin-1").split(None, 2)
+        if len(status) < 2 or status[1] != "200":
+            writer.close()
+            raise IOError("unexpected response from " + url + ": " + " ".join(status).strip())
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        return cls(reader, writer, headers, chunk_size)
+
+    async def _body(self, chunk_size):
+        """Yields the chunks of the response body as they arrive."""
+        reader = self.reader
+        if "chunked" in self.headers.get("transfer-encoding", "").lower():
+            while True:
+                size = int((await reader.readline()).split(b";", 1)[0], 16)
+                if size == 0:
+                    break
+                while size:
+                    chunk = await reader.read(min(size, chunk_size))
+                    if not chunk:
+                        raise IOError("connection closed in the middle of a chunk")
+                    size -= len(chunk)
+                    yield chunk
+                await reader.readline()
+        elif "content-length" in self.headers:
+            remaining = int(self.headers["content-length"])
+            while remaining:
+                chunk = await reader.read(min(remaining, chunk_size))
+                if not chunk:
+                    raise IOError("connection closed before the end of the body")
+                remaining -= len(chunk)
+                yield chunk
+        else:
+            chunk = await reader.read(chunk_size)
+            while chunk:
+                yield chunk
+                chunk = await reader.read(chunk_size)
+
+    async def _fill(self):
+        """Reads chunks until at least one token is available or the body is exhausted.
+
+        :return: True if a token is available, False otherwise.
+        """
+        while not self._tokens and not self._done:
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self._done = True
+                if self._carry:
+                    self._tokens.append(self._carry)
+                    self._carry = None
+                break
+            tokens, self._carry = _split_chunk(self._carry, chunk)
+            self._tokens.extend(tokens)
+        return bool(self._tokens)
+
+    async def _next_token(self, kind):
+        if not await self._fill():
+            raise NoSuchElementException("attempts to read a '" + kind + "' value from the input stream, "
+                                         + "but no more tokens are available")
+        return self._tokens.popleft()
+
+    async def isEmpty(self) -> bool:
+        """Returns true if this input stream has no more tokens.
+
+        :return: True if no more tokens are available, False otherwise.
+        """
+        return not await self._fill()
+
+    async def readString(self) -> str:
+        """Reads the next token from this input stream and returns it as a String.
+
+        @throws NoSuchElementException if the input stream is empty
+        :return: str
+        """
+        return (await self._next_token("String")).decode(self.CHARSET_NAME)
+
+    async def readInt(self) -> int:
+        """Reads the next token from this input stream, parses it as a int, and returns the int.
+
+        @throws NoSuchElementException if the input stream is empty
+        @throws InputMismatchException if the next token cannot be parsed as an int
+        :return: the next int in this input stream
+        """
+        token = await self._next_token("int")
+        try:
+            return int(token)
+        except ValueError:
+            raise InputMismatchException("attempts to read an 'int' value from the input stream, "
+                                         + "but the next token is \"" + token.decode(self.CHARSET_NAME)
+                                         + "\"") from None
+
+    async def readDouble(self) -> float:
+        """Reads the next token from this input stream, parses it as a float, and returns the float.
+
+        @throws NoSuchElementException if the input stream is empty
+        @throws InputMismatchException if the next token cannot be parsed as a float
+        :return: the next float in this input stream
+        """
+        token = await self._next_token("float")
+        try:
+            return float(token)
+        except ValueError:
+            raise InputMismatchException("attempts to read a 'float' value from the input stream, "
+                                         + "but the next token is \"" + token.decode(self.CHARSET_NAME)
+                                         + "\"") from None
+
+    async def _batches(self, typecode, parse):
+        while await self._fill():
+            tokens = self._tokens
+            self._tokens = collections.deque()
+            yield array(typecode, map(parse, tokens))
+
+    def intBatches(self):
+        """Returns an async iterator over the remaining tokens parsed as integers, one array('q') for each
+        chunk of tokens as it arrives.
+
+        @throws ValueError if a token cannot be parsed as an int
+        """
+        return self._batches("q", int)
+
+    def doubleBatches(self):
+        """Returns an async iterator over the remaining tokens parsed as doubles, one array('d') for each
+        chunk of tokens as it arrives.
+
+        @throws ValueError if a token cannot be parsed as a float
+        """
+        return self._batches("d", float)
+
+    async def readAllIntsArray(self):
+        """Reads all remaining tokens from this input stream, parses them as integers, and returns them as
+        an array('q').
+        """
+        result = array("q")
+        async for batch in self.intBatches():
+            result += batch
+        return result
+
+    async def readAllDoublesArray(self):
+        """Reads all remaining tokens from this input stream, parses them as doubles, and returns them as
+        an array('d').
+        """
+        result = array("d")
+        async for batch in self.doubleBatches():
+            result += batch
+        return result
+
+    async def readAllStrings(self) -> list:
+        """Reads all remaining tokens from this input stream and returns them as a list of strings.
+        """
+        return [token async for token in self]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not await self._fill():
+            raise StopAsyncIteration
+        return self._tokens.popleft().decode(self.CHARSET_NAME)
+
+    async def close(self):
+        """Closes the connection.
+
+        :return: None.
+        """
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+if __name__ == '__main__':
+    # % python AsyncIn.py https://algs4.cs.princeton.edu/44sp/tinyEWD.txt ...
+    # Downloads and sums the numbers of all given URLs concurrently.
+    import sys
+
+    async def total(url):
+        inp = await AsyncIn.open(url)
+        values = await inp.readAllDoublesArray()
+        await inp.close()
+        return url, len(values), sum(values)
+
+    async def main(urls):
+        for url, n, s in await asyncio.gather(*(total(url) for url in urls)):
+            print(url, n, s)
+
+    asyncio.run(main(sys.argv[1:]))
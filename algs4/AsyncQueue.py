@@ -0,0 +1,238 @@
+"""
+The AsyncQueue class is an asyncio version of BlockingQueue: a first-in-first-out (FIFO) queue shared by
+producer and consumer coroutines on one event loop.
+
+The capacity is a high-water mark. await enqueue suspends the producer while the queue holds capacity
+items, so a fast producer, such as an AsyncIn reader, cannot make the queue grow without limit while slow
+consumers catch up. await dequeue suspends the consumer while the queue is empty. dequeueUpTo(k) removes
+up to k items at once, so a consumer wakes once per batch rather than once per item. await close() marks
+the end of the stream: further enqueues raise QueueClosedException, consumers still receive the items
+that are left, and async iteration stops once the queue is closed and empty.
+
+The items are kept in a ResizingArrayQueue, with the isEmpty, size and peek operations of Queue.
+
+::
+
+    queue = AsyncQueue(1024)
+
+    async def produce(inp):             async def consume():
+        async for token in inp:             while True:
+            await queue.enqueue(token)          try:
+        await queue.close()                             batch = await queue.dequeueUpTo(256)
+                                                except QueueClosedException:
+                                                    break
+
+% python AsyncQueue.py
+"""
+
+import asyncio
+
+from BlockingQueue import QueueClosedException, QueueFullException
+from ResizingArrayQueue import NoSuchElementException, ResizingArrayQueue
+
+
+class AsyncQueue:
+
+    def __init__(self, capacity):
+        """Initializes an empty queue that holds at most capacity items.
+
+        :param capacity: the high-water mark, the maximum number of items on the queue.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        self.capacity = capacity
+        self.queue = ResizingArrayQueue()
+        self.closed = False
+        self.lock = asyncio.Lock()
+        self.notEmpty = asyncio.Condition(self.lock)
+        self.notFull = asyncio.Condition(self.lock)
+
+    def isEmpty(self):
+        """Returns true if this queue is empty.
+
+        :return: True if the queue is empty, False otherwise
+        """
+        return self.queue.isEmpty()
+
+    def size(self):
+        """Return the number of items in this queue.
+
+        :return: the number of items in this queue.
+        """
+        return self.queue.size()
+
+    def __len__(self):
+        return self.queue.size()
+
+    def isClosed(self):
+        """Returns true if this queue has been closed.
+        """
+        return self.closed
+
+    def peek(self):
+        """Returns the item least recently added to this queue, without removing it.
+
+        @throws NoSuchElementException if the queue is empty
+        :return: The item least recently added to the queue.
+        """
+        return self.queue.peek()
+
+    async def _wait(self, condition, ready, timeout):
+        """Waits on condition until ready() holds. Must be called with the lock held.
+
+        :return: True if ready() holds, False if the timeout expired.
+        """
+        if ready():
+            return True
+        try:
+            await asyncio.wait_for(condition.wait_for(ready), timeout)
+        except asyncio.TimeoutError:
+            return ready()
+        return True
+
+    async def enqueue(self, item, timeout=None):
+        """Adds the item to this queue, waiting for a free slot while the queue is at its high-water mark.
+
+        @throws QueueFullException if the queue is still full after the timeout
+        @throws QueueClosedException if the queue is closed
+        :param item: Item to add to the queue.
+        :param timeout: maximum number of seconds to wait, or None to wait indefinitely.
+        :return: None
+        """
+        async with self.lock:
+            if not await self._wait(self.notFull, lambda: self.closed or self.queue.n < self.capacity, timeout):
+                raise QueueFullException("Queue overflow.")
+            if self.closed:
+                raise QueueClosedException("Queue is closed.")
+            self.queue.enqueue(item)
+            self.notEmpty.notify()
+
+    async def enqueueMany(self, items, timeout=None):
+        """Adds all the items of an iterable to this queue, in order, waiting for free slots as needed.
+
+        @throws QueueFullException if not all items fit before the timeout; the items added so far stay on
+                the queue
+        @throws QueueClosedException if the queue is closed; the items added so far stay on the queue
+        :param items: iterable of items to add to the queue.
+        :param timeout: maximum number of seconds to wait in total, or None to wait indefinitely.
+        :return: None
+        """
+        items = list(items)
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        start = 0
+        while start < len(items):
+            async with self.lock:
+                remaining = None if deadline is None else max(0.0, deadline - loop.time())
+                if not await self._wait(self.notFull, lambda: self.closed or self.queue.n < self.capacity,
+                                        remaining):
+                    raise QueueFullException("Queue overflow after " + str(start) + " items.")
+                if self.closed:
+                    raise QueueClosedException("Queue is closed.")
+                end = start + self.capacity - self.queue.n
+                self.queue.enqueueMany(items[start:end])
+                start = end
+                self.notEmpty.notify_all()
+
+    async def dequeue(self, timeout=None):
+        """Removes and returns the item least recently added to this queue, waiting for one if the queue is
+        empty.
+
+        @throws NoSuchElementException if the queue is still empty after the timeout
+        @throws QueueClosedException if the queue is closed and empty
+        :param timeout: maximum number of seconds to wait, or None to wait indefinitely.
+        :return: the item on this queue that was least recently added
+        """
+        async with self.lock:
+            if not await self._wait(self.notEmpty, lambda: self.closed or self.queue.n > 0, timeout):
+                raise NoSuchElementException("Queue underflow.")
+            if self.queue.n == 0:
+                raise QueueClosedException("Queue is closed.")
+            item = self.queue.dequeue()
+            self.notFull.notify()
+            return item
+
+    async def dequeueUpTo(self, k, timeout=None):
+        """Removes and returns up to k items, least recently added first. Waits only until at least one item
+        is available.
+
+        @throws NoSuchElementException if the queue is still empty after the timeout
+        @throws QueueClosedException if the queue is closed and empty
+        :param k: maximum number of items to remove.
+        :param timeout: maximum number of seconds to wait, or None to wait indefinitely.
+        :return: list of the removed items
+        """
+        async with self.lock:
+            if not await self._wait(self.notEmpty, lambda: self.closed or self.queue.n > 0, timeout):
+                raise NoSuchElementException("Queue underflow.")
+            if self.queue.n == 0:
+                raise QueueClosedException("Queue is closed.")
+            items = self.queue.dequeueMany(k)
+            self.notFull.notify_all()
+            return items
+
+    async def drain(self):
+        """Removes and returns all the items currently on this queue, without waiting for more.
+
+        :return: list of the items, least recently added first
+        """
+        async with self.lock:
+            items = self.queue.drain()
+            self.notFull.notify_all()
+            return items
+
+    async def close(self):
+        """Closes this queue. Further enqueues raise QueueClosedException, while the items left on the queue
+        can still be dequeued. Coroutines waiting on the queue are woken up.
+
+        :return: None
+        """
+        async with self.lock:
+            self.closed = True
+            self.notEmpty.notify_all()
+            self.notFull.notify_all()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.dequeue()
+        except QueueClosedException:
+            raise StopAsyncIteration
+
+
+if __name__ == '__main__':
+    # A fast producer and a slow consumer: the queue stays below its high-water mark, and dequeueUpTo
+    # wakes the consumer once per batch.
+    import time
+
+    N = 100000
+    CAPACITY = 1024
+
+    async def produce(queue):
+        for i in range(N):
+            await queue.enqueue(i)
+        await queue.close()
+
+    async def run(batch):
+        queue = AsyncQueue(CAPACITY)
+        producer = asyncio.create_task(produce(queue))
+        wakeups = peak = total = 0
+        start = time.perf_counter()
+        while True:
+            try:
+                items = await queue.dequeueUpTo(batch)
+            except QueueClosedException:
+                break
+            wakeups += 1
+            total += len(items)
+            peak = max(peak, queue.size() + len(items))
+            await asyncio.sleep(0)      # waiting on a graph worker
+        await producer
+        elapsed = time.perf_counter() - start
+        print("batch {batch}: {rate:.0f} items/s, {wakeups} consumer wakeups, peak size {peak}".format(
+            batch=batch, rate=total / elapsed, wakeups=wakeups, peak=peak))
+
+    for batch in (1, 64, CAPACITY):
+        asyncio.run(run(batch))
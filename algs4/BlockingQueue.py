@@ -0,0 +1,247 @@
+"""
+The BlockingQueue class represents a bounded first-in-first-out (FIFO) queue that can be shared by several
+producer and consumer threads.
+
+enqueue blocks while the queue is full and dequeue blocks while it is empty, optionally with a timeout;
+with block=False they raise QueueFullException or NoSuchElementException instead. The batch operations
+enqueueMany and dequeueMany acquire the lock once per batch rather than once per item. close() marks the
+end of the stream: further enqueues raise QueueClosedException, consumers still receive the items that
+are left, and once the queue is empty dequeue raises QueueClosedException.
+
+The items are kept in a ResizingArrayQueue guarded by a single lock with two condition variables.
+
+::
+
+    queue = BlockingQueue(1024)
+    # producer                          # consumer
+    queue.enqueueMany(tokens)           while True:
+    queue.close()                           try:
+                                                batch = queue.dequeueMany(256)
+                                            except QueueClosedException:
+                                                break
+
+% python BlockingQueue.py
+"""
+
+import threading
+import time
+
+from ResizingArrayQueue import NoSuchElementException, ResizingArrayQueue
+
+
+class QueueFullException(Exception):
+    pass
+
+
+class QueueClosedException(Exception):
+    pass
+
+
+class BlockingQueue:
+
+    def __init__(self, capacity):
+        """Initializes an empty queue that holds at most capacity items.
+
+        :param capacity: the maximum number of items on the queue.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive.")
+        self.capacity = capacity
+        self.queue = ResizingArrayQueue()
+        self.closed = False
+        self.lock = threading.Lock()
+        self.notEmpty = threading.Condition(self.lock)
+        self.notFull = threading.Condition(self.lock)
+
+    def isEmpty(self):
+        """Returns true if this queue is empty.
+
+        :return: True if the queue is empty, False otherwise
+        """
+        with self.lock:
+            return self.queue.isEmpty()
+
+    def size(self):
+        """Return the number of items in this queue.
+
+        :return: the number of items in this queue.
+        """
+        with self.lock:
+            return self.queue.size()
+
+    def isClosed(self):
+        """Returns true if this queue has been closed.
+        """
+        with self.lock:
+            return self.closed
+
+    def peek(self):
+        """Returns the item least recently added to this queue, without removing it.
+
+        @throws NoSuchElementException if the queue is empty
+        :return: The item least recently added to the queue.
+        """
+        with self.lock:
+            return self.queue.peek()
+
+    def _wait(self, condition, ready, block, timeout):
+        """Waits on condition until ready() holds. Must be called with the lock held.
+
+        :return: True if ready() holds, False if block is False or the timeout expired.
+        """
+        if not block:
+            return ready()
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return True
+        return condition.wait_for(ready, timeout)
+
+    def enqueue(self, item, block=True, timeout=None):
+        """Adds the item to this queue, waiting for a free slot if the queue is full.
+
+        @throws QueueFullException if the queue is still full after the timeout, or at once if block is False
+        @throws QueueClosedException if the queue is closed
+        :param item: Item to add to the queue.
+        :param block: wait while the queue is full.
+        :param timeout: maximum number of seconds to wait, or None to wait indefinitely.
+        :return: None
+        """
+        with self.lock:
+            if not self._wait(self.notFull, lambda: self.closed or self.queue.n < self.capacity, block, timeout):
+                raise QueueFullException("Queue overflow.")
+            if self.closed:
+                raise QueueClosedException("Queue is closed.")
+            self.queue.enqueue(item)
+            self.notEmpty.notify()
+
+    def enqueueMany(self, items, block=True, timeout=None):
+        """Adds all the items of an iterable to this queue, in order.
+
+        The items are added in as few steps as the free space allows, each under a single acquisition of the
+        lock. If the queue fills up, the remaining items wait for free slots like enqueue does.
+
+        @throws QueueFullException if not all items fit before the timeout, or at once if block is False;
+                the items added so far stay on the queue
+        @throws QueueClosedException if the queue is closed
+        :param items: iterable of items to add to the queue.
+        :param block: wait while the queue is full.
+        :param timeout: maximum number of seconds to wait in total, or None to wait indefinitely.
+        :return: None
+        """
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        while start < len(items):
+            with self.lock:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not self._wait(self.notFull, lambda: self.closed or self.queue.n < self.capacity,
+                                  block, remaining):
+                    raise QueueFullException("Queue overflow after " + str(start) + " items.")
+                if self.closed:
+                    raise QueueClosedException("Queue is closed.")
+                end = start + self.capacity - self.queue.n
+                self.queue.enqueueMany(items[start:end])
+                start = end
+                self.notEmpty.notify_all()
+
+    def dequeue(self, block=True, timeout=None):
+        """Removes and returns the item least recently added to this queue, waiting for one if the queue is
+        empty.
+
+        @throws NoSuchElementException if the queue is still empty after the timeout, or at once if block is
+                False
+        @throws QueueClosedException if the queue is closed and empty
+        :param block: wait while the queue is empty.
+        :param timeout: maximum number of seconds to wait, or None to wait indefinitely.
+        :return: the item on this queue that was least recently added
+        """
+        with self.lock:
+            if not self._wait(self.notEmpty, lambda: self.closed or self.queue.n > 0, block, timeout):
+                raise NoSuchElementException("Queue underflow.")
+            if self.queue.n == 0:
+                raise QueueClosedException("Queue is closed.")
+            item = self.queue.dequeue()
+            self.notFull.notify()
+            return item
+
+    def dequeueMany(self, k, block=True, timeout=None):
+        """Removes and returns up to k items, least recently added first, under a single acquisition of the
+        lock. Waits only until at least one item is available.
+
+        @throws NoSuchElementException if the queue is still empty after the timeout, or at once if block is
+                False
+        @throws QueueClosedException if the queue is closed and empty
+        :param k: maximum number of items to remove.
+        :param block: wait while the queue is empty.
+        :param timeout: maximum number of seconds to wait, or None to wait indefinitely.
+        :return: list of the removed items
+        """
+        with self.lock:
+            if not self._wait(self.notEmpty, lambda: self.closed or self.queue.n > 0, block, timeout):
+                raise NoSuchElementException("Queue underflow.")
+            if self.queue.n == 0:
+                raise QueueClosedException("Queue is closed.")
+            items = self.queue.dequeueMany(k)
+            self.notFull.notify_all()
+            return items
+
+    def drain(self):
+        """Removes and returns all the items currently on this queue, without waiting.
+
+        :return: list of the items, least recently added first
+        """
+        with self.lock:
+            items = self.queue.drain()
+            self.notFull.notify_all()
+            return items
+
+    def close(self):
+        """Closes this queue. Further enqueues raise QueueClosedException, while the items left on the queue
+        can still be dequeued. Threads waiting on the queue are woken up.
+
+        :return: None
+        """
+        with self.lock:
+            self.closed = True
+            self.notEmpty.notify_all()
+            self.notFull.notify_all()
+
+
+if __name__ == '__main__':
+    # Throughput of an I/O-bound pipeline stage for different numbers of producer and consumer threads.
+    N = 20000
+    BATCH = 100
+
+    def produce(queue, count):
+        for start in range(0, count, BATCH):
+            time.sleep(0.001)   # waiting on input
+            queue.enqueueMany(range(start, min(start + BATCH, count)))
+
+    def consume(queue, totals):
+        total = 0
+        while True:
+            try:
+                batch = queue.dequeueMany(BATCH)
+            except QueueClosedException:
+                break
+            time.sleep(0.001)   # waiting on output
+            total += len(batch)
+        totals.append(total)
+
+    for threads in (1, 2, 4, 8):
+        queue = BlockingQueue(1024)
+        totals = []
+        producers = [threading.Thread(target=produce, args=(queue, N // threads)) for i in range(threads)]
+        consumers = [threading.Thread(target=consume, args=(queue, totals)) for i in range(threads)]
+        start = time.perf_counter()
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        queue.close()
+        for thread in consumers:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        print("{threads} producers, {threads} consumers: {rate:.0f} items/s".format(
+            threads=threads, rate=sum(totals) / elapsed))
@@ -10,7 +10,7 @@ of edges <em>E</em>. Parallel edges and self-loops are permitted.
 <p>
 
 This implementation uses an adjacency-lists representation, which
-is a vertex-indexed array of {@link Bag} objects.
+is a vertex-indexed array of {@link ResizingArrayBag} objects.
 All operations take constant time (in the worst case) except
 iterating over the edges incident from a given vertex, which takes
 time proportional to the number of such edges.
@@ -22,19 +22,27 @@ see <a href="https://algs4.cs.princeton.edu/44sp">Section 4.4</a> of
 """
 
 import random
+from array import array
 
-from Bag import Bag
+from BinaryEdgeList import BinaryEdgeList
 from DirectedEdge import DirectedEdge
+from IntBag import IntBag
+from ResizingArrayBag import ResizingArrayBag
 
 
 class EdgeWeightedDigraph:
 
     def __init__(self, V=None, E=None, In=None):
-        """Initializes an empty edge-weighted digraph with {@code V} vertices and {@code E} edges.
+        """Initializes an edge-weighted digraph.
 
-        @throws ValueError if {@code V < 0}
+        With V only, the digraph has V vertices and no edges. With V and E, E random edges are added.
+        With In, the number of vertices, the number of edges and the edges (pairs of vertices followed
+        by a weight) are read from the input stream.
+
+        @throws ValueError if {@code V < 0} or {@code E < 0}
         :param V: the number of vertices.
         :param E: the number of edges.
+        :param In: the input stream.
         """
         if V is not None and V < 0:
             raise ValueError("Number of vertices in a Digraph must be nonnegative.")
@@ -45,27 +53,54 @@ class EdgeWeightedDigraph:
         if E is None and V is None and In is None:
             raise ValueError("Invalid ")
 
-        if V is not None and E is None:
-            for v in range(V):
-                self.adj[v] = Bag()
-
-        if V is not None and E is not None:
-            self.V = V
-            for v in range(V):
-                self.adj[v] = Bag()
-            for e in range(E):
-                v1 = random.choice(range(self.V))
-                v2 = random.choice(range(self.V))
-                w = random.randint() * 100
-                self.addEdge(DirectedEdge(v1, v2, w))
+        if In is not None:
+            V, E, tails, heads, weights = In.readEdges()
+            if V < 0:
+                raise ValueError("Number of vertices in a Digraph must be nonnegative.")
 
+        self.V = V
         self.E = 0
-
-        self.indegree = []
-        self.adj = []
+        self.adj = [ResizingArrayBag() for v in range(V)]
+        self.indegree = [0] * V
 
         if In is not None:
-            pass
+            if E < 0:
+                raise ValueError("Number of Edges in a Digraph must be nonnegative.")
+            self.addEdges(tails, heads, weights)
+        elif E is not None:
+            for e in range(E):
+                v = random.randrange(self.V)
+                w = random.randrange(self.V)
+                weight = random.randrange(100) * 0.01
+                self.addEdge(DirectedEdge(v, w, weight))
+
+    @classmethod
+    def readBinary(cls, path):
+        """Reads an edge-weighted digraph from a file in the BinaryEdgeList format.
+
+        @throws ValueError if the file holds an undirected graph
+        :param path: path of the file.
+        :return: the edge-weighted digraph.
+        """
+        V, E, tails, heads, weights, directed = BinaryEdgeList.read(path)
+        if not directed:
+            raise ValueError(str(path) + " holds an undirected graph.")
+        G = cls(V)
+        G.addEdges(tails, heads, weights)
+        return G
+
+    def writeBinary(self, path):
+        """Writes this edge-weighted digraph to a file in the BinaryEdgeList format.
+
+        :param path: path of the file.
+        :return: None
+        """
+        tails, heads, weights = array("i"), array("i"), array("d")
+        for e in self.edges():
+            tails.append(e.from_vertex())
+            heads.append(e.to_vertex())
+            weights.append(e.weight)
+        BinaryEdgeList.write(path, self.V, tails, heads, weights, directed=True)
 
     def addEdge(self, edge: DirectedEdge):
         """
@@ -84,6 +119,32 @@ class EdgeWeightedDigraph:
 
         self.adj[v].add(edge)
         self.indegree[w] += 1
+        self.E += 1
+
+    def addEdges(self, tails, heads, weights):
+        """Adds a batch of directed edges given as three columns.
+
+        throw ValueError unless all endpoints are between {@code 0} and {@code V-1}
+
+        :param tails: the tail vertex of each edge.
+        :param heads: the head vertex of each edge.
+        :param weights: the weight of each edge.
+        :return: None
+        """
+        if len(tails) != len(heads) or len(tails) != len(weights):
+            raise ValueError("Edge columns must all have the same length.")
+        if not tails:
+            return
+        for column in (tails, heads):
+            self.validateVertex(min(column))
+            self.validateVertex(max(column))
+
+        adj = self.adj
+        indegree = self.indegree
+        for v, w, weight in zip(tails, heads, weights):
+            adj[v].add(DirectedEdge(v, w, weight))
+            indegree[w] += 1
+        self.E += len(tails)
 
     def validateVertex(self, v):
         """ Validate the value of the vertex  v.
@@ -91,7 +152,7 @@ class EdgeWeightedDigraph:
         :param v: vertex to validate
         :return: True for a valid version, or raise a ValueError
         """
-        if v < 0 or v > self.V:
+        if v < 0 or v >= self.V:
             raise ValueError("Vertex {v} cannot be less than 0 or greater than V")
 
         return True
@@ -122,6 +183,48 @@ class EdgeWeightedDigraph:
         self.validateVertex(v)
         return self.adj[v]
 
+    @classmethod
+    def neighborBagsFromEdges(cls, V, tails, heads, typecode="i"):
+        """Builds the adjacency lists of vertex ids of a digraph directly from edge columns, such as those
+        returned by In.readEdges or BinaryEdgeList.read, without creating a digraph or any edge objects.
+        Use this instead of neighborBags when only the adjacency structure is needed, to keep the memory
+        footprint low.
+
+        throw ValueError unless all endpoints are between {@code 0} and {@code V-1}
+
+        :param V: the number of vertices.
+        :param tails: the tail vertex of each edge.
+        :param heads: the head vertex of each edge.
+        :param typecode: "i" or "q", the item type of the IntBag objects.
+        :return: list whose entry v is an IntBag of the heads of the edges incident from v
+        """
+        if V < 0:
+            raise ValueError("Number of vertices must be nonnegative.")
+        if len(tails) != len(heads):
+            raise ValueError("Edge columns must all have the same length.")
+        for column in (tails, heads):
+            if column and (min(column) < 0 or max(column) >= V):
+                raise ValueError("Vertices must be between 0 and V - 1.")
+        bags = [IntBag(typecode) for v in range(V)]
+        for v, w in zip(tails, heads):
+            bags[v].add(w)
+        return bags
+
+    def neighborBags(self, typecode="i"):
+        """Returns the adjacency lists as vertex ids only, dropping the edge objects and weights. For
+        unweighted traversals the IntBag lists take a fraction of the memory, and each can be exported as a
+        memoryview. To avoid building the edge objects at all, use neighborBagsFromEdges.
+
+        :param typecode: "i" or "q", the item type of the IntBag objects.
+        :return: list whose entry v is an IntBag of the heads of the edges incident from v
+        """
+        bags = []
+        for v in range(self.V):
+            bag = IntBag(typecode)
+            bag.extend([e.to_vertex() for e in self.adj[v]])
+            bags.append(bag)
+        return bags
+
     def outDegree(self, v):
         """Returns the number of directed edges incident from vertex {@code v}.
           This is known as the <em>outdegree</em> of vertex {@code v}.
@@ -155,7 +258,7 @@ class EdgeWeightedDigraph:
         """
         l = []
         for v in range(self.vertices()):
-            l.append(self.adj[v])
+            l.extend(self.adj[v])
         return l
 
     def __str__(self):
@@ -12,7 +12,7 @@ of <em>v</em>.
 <p>
 
 This implementation uses an adjacency-lists representation, which
-is a vertex-indexed array of {@link Bag} objects.
+is a vertex-indexed array of {@link ResizingArrayBag} objects.
 All operations take constant time (in the worst case) except
 iterating over the edges incident to a given vertex, which takes
 time proportional to the number of such edges.
@@ -21,8 +21,12 @@ For additional documentation,
 see <a href="https://algs4.cs.princeton.edu/43mst">Section 4.3</a> of
 <i>Algorithms, 4th Edition</i> by Robert Sedgewick and Kevin Wayne.
 """
-import DirectedEdge
-from Bag import Bag
+from array import array
+
+from BinaryEdgeList import BinaryEdgeList
+from DirectedEdge import DirectedEdge
+from IntBag import IntBag
+from ResizingArrayBag import ResizingArrayBag
 
 
 class IllegalArgumentException(Exception):
@@ -43,28 +47,60 @@ class EdgeWeightedGraph:
         if E is None and V is None and In is None and G is None:
             raise ValueError("One of E, V, In or G argument must be given.")
 
+        if In is not None:
+            V, E, tails, heads, weights = In.readEdges()
+
         if V is not None:
             if V < 0:
                 raise IllegalArgumentException("Number of vertices must be non-negative.")
             self.V = V
             self.E = 0
             for v in range(self.V):
-                self.adj.append(Bag())
+                self.adj.append(ResizingArrayBag())
+            self.indegree = [0] * V
 
-        if E is not None:
+        if In is not None:
             if E < 0:
                 raise IllegalArgumentException("Number of Edges must be non-negative.")
-            self.E = E
-
-        if In is not None:
-            E = In.readInt()
+            self.addEdges(tails, heads, weights)
+        elif E is not None:
             if E < 0:
                 raise IllegalArgumentException("Number of Edges must be non-negative.")
+            self.E = E
 
         if G is not None:
             self.G = G
             self.V = G.V()
 
+    @classmethod
+    def readBinary(cls, path):
+        """Reads an edge-weighted graph from a file in the BinaryEdgeList format.
+
+        @throws ValueError if the file holds a directed graph
+        :param path: path of the file.
+        :return: the edge-weighted graph.
+        """
+        V, E, tails, heads, weights, directed = BinaryEdgeList.read(path)
+        if directed:
+            raise ValueError(str(path) + " holds a directed graph.")
+        G = cls(V=V)
+        G.addEdges(tails, heads, weights)
+        return G
+
+    def writeBinary(self, path):
+        """Writes this edge-weighted graph to a file in the BinaryEdgeList format.
+        Each undirected edge is written once.
+
+        :param path: path of the file.
+        :return: None
+        """
+        tails, heads, weights = array("i"), array("i"), array("d")
+        for e in self.edges():
+            tails.append(e.from_vertex())
+            heads.append(e.to_vertex())
+            weights.append(e.weight)
+        BinaryEdgeList.write(path, self.V, tails, heads, weights, directed=False)
+
     def vertices(self):
         """Returns the number of vertices in this edge-weighted digraph.
         """
@@ -90,7 +126,7 @@ class EdgeWeightedGraph:
         :param v: vertex to validate
         :return: True for a valid version, or raise a ValueError
         """
-        if v < 0 or v > self.V:
+        if v < 0 or v >= self.V:
             raise ValueError("Vertex {v} cannot be less than 0 or greater than V")
 
         return True
@@ -107,6 +143,50 @@ class EdgeWeightedGraph:
         self.validateVertex(v)
         return self.adj[v]
 
+    @classmethod
+    def neighborBagsFromEdges(cls, V, tails, heads, typecode="i"):
+        """Builds the adjacency lists of vertex ids of a graph directly from edge columns, such as those
+        returned by In.readEdges or BinaryEdgeList.read, without creating a graph or any edge objects.
+        Use this instead of neighborBags when only the adjacency structure is needed, to keep the memory
+        footprint low. A self-loop at v lists v twice.
+
+        throw ValueError unless all endpoints are between {@code 0} and {@code V-1}
+
+        :param V: the number of vertices.
+        :param tails: one endpoint of each edge.
+        :param heads: the other endpoint of each edge.
+        :param typecode: "i" or "q", the item type of the IntBag objects.
+        :return: list whose entry v is an IntBag of the vertices adjacent to v
+        """
+        if V < 0:
+            raise ValueError("Number of vertices must be nonnegative.")
+        if len(tails) != len(heads):
+            raise ValueError("Edge columns must all have the same length.")
+        for column in (tails, heads):
+            if column and (min(column) < 0 or max(column) >= V):
+                raise ValueError("Vertices must be between 0 and V - 1.")
+        bags = [IntBag(typecode) for v in range(V)]
+        for v, w in zip(tails, heads):
+            bags[v].add(w)
+            bags[w].add(v)
+        return bags
+
+    def neighborBags(self, typecode="i"):
+        """Returns the adjacency lists as vertex ids only, dropping the edge objects and weights. For
+        unweighted traversals the IntBag lists take a fraction of the memory, and each can be exported as a
+        memoryview. To avoid building the edge objects at all, use neighborBagsFromEdges. A self-loop at v
+        lists v twice.
+
+        :param typecode: "i" or "q", the item type of the IntBag objects.
+        :return: list whose entry v is an IntBag of the vertices adjacent to v
+        """
+        bags = []
+        for v in range(self.V):
+            bag = IntBag(typecode)
+            bag.extend([e.to_vertex() if e.from_vertex() == v else e.from_vertex() for e in self.adj[v]])
+            bags.append(bag)
+        return bags
+
     def outDegree(self, v):
         """Returns the number of directed edges incident from vertex {@code v}.
           This is known as the <em>outdegree</em> of vertex {@code v}.
@@ -133,14 +213,23 @@ class EdgeWeightedGraph:
 
     def edges(self):
         """
-        Returns all directed edges in this edge-weighted digraph.
-        To iterate over the edges in this edge-weighted digraph, use foreach notation:
+        Returns all edges in this edge-weighted graph, each undirected edge once.
+        To iterate over the edges in this edge-weighted graph, use foreach notation:
         {@code for (DirectedEdge e : G.edges())}.
-        @return all edges in this edge-weighted digraph, as an iterable.
+        @return all edges in this edge-weighted graph, as an iterable.
         """
         l = []
         for v in range(self.vertices()):
-            l.append(self.adj[v])
+            selfLoops = 0
+            for e in self.adj[v]:
+                if e.from_vertex() != v:
+                    continue
+                if e.to_vertex() == v:
+                    # a self-loop is stored twice in the adjacency list of v
+                    selfLoops += 1
+                    if selfLoops % 2 == 0:
+                        continue
+                l.append(e)
         return l
 
     def addEdge(self, edge: DirectedEdge):
@@ -165,6 +254,35 @@ class EdgeWeightedGraph:
         self.indegree[v] += 1
         self.E += 1
 
+    def addEdges(self, tails, heads, weights):
+        """
+        Adds a batch of edges given as three columns. Each edge is added between vertices in both directions.
+
+        throw ValueError unless all endpoints are between {@code 0} and {@code V-1}
+
+        :param tails: one endpoint of each edge.
+        :param heads: the other endpoint of each edge.
+        :param weights: the weight of each edge.
+        :return: None
+        """
+        if len(tails) != len(heads) or len(tails) != len(weights):
+            raise ValueError("Edge columns must all have the same length.")
+        if not tails:
+            return
+        for column in (tails, heads):
+            self.validateVertex(min(column))
+            self.validateVertex(max(column))
+
+        adj = self.adj
+        indegree = self.indegree
+        for v, w, weight in zip(tails, heads, weights):
+            edge = DirectedEdge(v, w, weight)
+            adj[v].add(edge)
+            adj[w].add(edge)
+            indegree[v] += 1
+            indegree[w] += 1
+        self.E += len(tails)
+
     def __str__(self):
         """Returns a string representation of this edge-weighted graph.
 
@@ -0,0 +1,125 @@
+"""
+The ExponentialAccumulator class is a data type for computing the exponentially weighted moving mean,
+standard deviation, and variance of a stream of real numbers, so recent data values count more than old
+ones.
+
+Each data value starts with weight 1, and the weights decay geometrically: by a factor 1 - alpha each
+time a new value is added, or, given a half-life, by half every halfLife seconds. The weighted mean and
+the weighted sum of squared deviations are updated with the incremental algorithm of West, which
+generalizes that of Welford used by Accumulator. With a smoothing factor alpha the mean is the familiar
+exponential moving average mu += alpha * (x - mu) once about 1 / alpha values have been added.
+
+Each operation takes constant time in the worst case.
+The amount of memory is constant - the data values are not stored.
+
+This technique is due to
+<a href = "https://doi.org/10.1145/359146.359153">D. H. D. West</a>.
+
+% python ExponentialAccumulator.py
+"""
+
+import math
+import time
+
+
+class ExponentialAccumulator:
+
+    __slots__ = ("n", "weight", "sum", "mu", "alpha", "halfLife", "last", "clock")
+
+    def __init__(self, alpha=None, halfLife=None, clock=time.monotonic):
+        """Initializes an empty accumulator, decaying per data value with smoothing factor alpha, or over
+        time with the given half-life.
+
+        :param alpha: the smoothing factor, between 0 and 1.
+        :param halfLife: the time in seconds after which the weight of a data value is halved.
+        :param clock: function returning the current time in seconds, for a half-life.
+        """
+        if (alpha is None) == (halfLife is None):
+            raise ValueError("Exactly one of alpha or halfLife must be given.")
+        if alpha is not None and not 0.0 < alpha <= 1.0:
+            raise ValueError("Smoothing factor must be between 0 and 1.")
+        if halfLife is not None and halfLife <= 0:
+            raise ValueError("Half-life must be positive.")
+        self.n = 0          # number of data values
+        self.weight = 0.0   # total weight of the data values
+        self.sum = 0.0      # weighted variance * weight
+        self.mu = 0.0       # weighted mean
+        self.alpha = alpha
+        self.halfLife = halfLife
+        self.clock = clock
+        self.last = None    # time of the last data value, for a half-life
+
+    def _decay(self):
+        """Returns the factor by which the weights decay when a data value is added."""
+        if self.halfLife is None:
+            return 1.0 - self.alpha
+        now = self.clock()
+        decay = 1.0 if self.last is None else 0.5 ** ((now - self.last) / self.halfLife)
+        self.last = now
+        return decay
+
+    def addDataValue(self, x):
+        """Adds a data value.
+
+        :param x: the data value.
+        :return: None
+        """
+        decay = self._decay()
+        self.n += 1
+        self.weight = self.weight * decay + 1.0
+        self.sum *= decay
+        delta = x - self.mu
+        self.mu += delta / self.weight
+        self.sum += delta * (x - self.mu)
+
+    def mean(self):
+        """Return the weighted mean of the data values.
+
+        :return: the mean value.
+        """
+        return self.mu
+
+    def var(self):
+        """Returns the weighted variance of the data values.
+
+        :return: variance
+        """
+        if self.n <= 1:
+            return math.nan
+
+        return self.sum / self.weight
+
+    def stddev(self):
+        """Returns the weighted standard deviation of the data values.
+
+        :return: standard deviation
+        """
+        return math.sqrt(self.var())
+
+    def count(self):
+        """
+        Returns the number of data values.
+
+        :return: Total number of data values.
+        """
+        return self.n
+
+    def __str__(self):
+        """String representation of accumulator.
+
+        :return: string representation of accumulator
+        """
+        return "n = " + str(self.n) + ", mean = " + str(self.mean()) + ", stddev = " + str(self.stddev())
+
+
+if __name__ == '__main__':
+    # Updates per second, and the statistics of a stream whose mean shifts halfway through.
+    import random
+
+    N = 1000000
+    ewma = ExponentialAccumulator(alpha=0.001)
+    start = time.perf_counter()
+    for i in range(N):
+        ewma.addDataValue(random.gauss(0.0 if i < N // 2 else 10.0, 1.0))
+    elapsed = time.perf_counter() - start
+    print("{:.0f} updates/s, {}".format(N / elapsed, ewma))
@@ -13,12 +13,29 @@ the following end-of-line delimeter, while reading a character consumes nothing
 Whitespace is defined in {@link Character#isWhitespace(char)}. Newlines consist of \n, \r, \r\n, and Unicode hex code
 points 0x2028, 0x2029, 0x0085;
 """
+import io
+import os
 import re
+import bz2
+import sys
+import struct
+import gzip
+import lzma
+import itertools
+import mmap
 import locale
+import socket
+import concurrent.futures
 import urllib.request
 import urllib.parse
+from array import array
 from typing import Iterator
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class InputMismatchException(Exception):
     pass
@@ -28,6 +45,179 @@ class NoSuchElementException(Exception):
     pass
 
 
+def _split_chunk(carry, chunk):
+    """Splits a str or bytes chunk into whitespace separated tokens.
+
+    carry is the unfinished last token of the previous chunk, or None. Returns the complete tokens and the
+    new carry, the last token of this chunk if the chunk does not end with whitespace.
+    """
+    if carry:
+        chunk = carry + chunk
+    tokens = chunk.split()
+    if tokens and not chunk[-1:].isspace():
+        return tokens, tokens.pop()
+    return tokens, None
+
+
+def _scan_tokens(chunks):
+    """Splits an iterable of str or bytes chunks into whitespace separated tokens.
+
+    A token that straddles the boundary between two chunks is carried over and joined with the start of the
+    next chunk, so only one chunk and at most one partial token are held in memory at any time.
+
+    :param chunks: iterable of str or bytes chunks.
+    :return: iterator over the tokens.
+    """
+    carry = None
+    for chunk in chunks:
+        tokens, carry = _split_chunk(carry, chunk)
+        yield from tokens
+    if carry:
+        yield carry
+
+
+def _parse_range(path, start, end, typecode):
+    """Parses the tokens in the byte range [start, end) of a local file into an array of the given typecode.
+
+    This runs in a worker process of In.readAllIntsParallel and In.readAllDoublesParallel.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    parse = float if typecode == "d" else int
+    return array(typecode, map(parse, data.split()))
+
+
+class LineIndex:
+    """
+    A persistent index of the line start offsets of a local file, for random access to its lines.
+
+    The index is built once in a single streaming pass over the file and stored next to it in a sidecar
+    file (path + ".idx") holding a small header followed by the offsets as 64-bit integers in native
+    byte order. The sidecar is memory-mapped, so opening an index takes constant time and memory, and
+    the byte range of any line is found in constant time. The header records the size and modification
+    time of the file, and a stale index is rebuilt automatically.
+    """
+
+    SUFFIX = ".idx"
+    MAGIC = b"AL4I"
+    VERSION = 1
+
+    # magic, version, padding, size and modification time (ns) of the indexed file
+    HEADER = struct.Struct("=4sHHqq")
+
+    # number of bytes read at a time while building the index
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, path, index_path=None, rebuild=False):
+        """Opens the index of the given file, building it first if it is missing or stale.
+
+        :param path: path of the indexed file.
+        :param index_path: path of the sidecar index, path + ".idx" by default.
+        :param rebuild: if True, always rebuild the index.
+        """
+        self.path = os.fspath(path)
+        self.index_path = index_path if index_path is not None else self.path + self.SUFFIX
+        if rebuild or not self._is_current():
+            self.build(self.path, self.index_path)
+
+        with open(self.index_path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = memoryview(self._map)[self.HEADER.size:].cast("q")
+        self._data = open(self.path, "rb")
+
+    def _is_current(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                header = f.read(self.HEADER.size)
+        except FileNotFoundError:
+            return False
+        if len(header) != self.HEADER.size:
+            return False
+        magic, version, _, size, mtime = self.HEADER.unpack(header)
+        stat = os.stat(self.path)
+        return (magic, version, size, mtime) == (self.MAGIC, self.VERSION, stat.st_size, stat.st_mtime_ns)
+
+    @classmethod
+    def build(cls, path, index_path=None):
+        """Builds the index of a file in one streaming pass and writes it to the sidecar file.
+
+        :param path: path of the file to index.
+        :param index_path: path of the sidecar index, path + ".idx" by default.
+        :return: None
+        """
+        path = os.fspath(path)
+        if index_path is None:
+            index_path = path + cls.SUFFIX
+        stat = os.stat(path)
+        size = stat.st_size
+        tmp = index_path + ".tmp"
+        with open(path, "rb") as data, open(tmp, "wb") as index:
+            index.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, size, stat.st_mtime_ns))
+            offsets = array("q", [0] if size else [])
+            position = 0
+            chunk = data.read(cls.CHUNK_SIZE)
+            while chunk:
+                newline = chunk.find(b"\n")
+                while newline >= 0:
+                    if position + newline + 1 < size:
+                        offsets.append(position + newline + 1)
+                    newline = chunk.find(b"\n", newline + 1)
+                position += len(chunk)
+                offsets.tofile(index)
+                del offsets[:]
+                chunk = data.read(cls.CHUNK_SIZE)
+            # the end of the file closes the last line
+            array("q", [size]).tofile(index)
+        os.replace(tmp, index_path)
+
+    def __len__(self):
+        """Returns the number of lines in the file."""
+        return len(self._offsets) - 1
+
+    def offsets(self, n):
+        """Returns the byte range of line n, including its line separator.
+
+        @throws IndexError unless {@code 0 <= n < len(self)}
+        :param n: the line number, starting at 0.
+        :return: a tuple (start, end) of byte offsets
+        """
+        if n < 0 or n >= len(self):
+            raise IndexError("line " + str(n) + " is out of range")
+        return self._offsets[n], self._offsets[n + 1]
+
+    def readRange(self, start, end):
+        """Reads the bytes in the range [start, end) of the file.
+
+        :return: the bytes
+        """
+        self._data.seek(start)
+        return self._data.read(end - start)
+
+    def readLine(self, n):
+        """Reads line n of the file, excluding the line separator.
+
+        @throws IndexError unless {@code 0 <= n < len(self)}
+        :param n: the line number, starting at 0.
+        :return: the line, as bytes
+        """
+        line = self.readRange(*self.offsets(n))
+        if line.endswith(b"\n"):
+            line = line[:-1]
+            if line.endswith(b"\r"):
+                line = line[:-1]
+        return line
+
+    def close(self):
+        """Closes the index and the indexed file.
+
+        :return: None
+        """
+        self._offsets.release()
+        self._map.close()
+        self._data.close()
+
+
 class In:
     """
     Input. This class provides methods for reading strings and numbers from standard input, file input, URLs, and
@@ -60,33 +250,225 @@ class In:
 
     EVERYTHING_PATTERN = re.compile(r"""\A  # Matches only at the start of the string.""", re.X)
 
-    def __init__(self, fobj=None, url=None):
-
-        if fobj:
+    # matches a single ASCII whitespace byte, used to align byte ranges to token boundaries
+    BYTE_WHITESPACE_PATTERN = re.compile(rb"\s")
+
+    # magic bytes of the compressed formats that are decompressed transparently, with their openers
+    COMPRESSED_FORMATS = (
+        (b"\x1f\x8b", gzip.open),
+        (b"BZh", bz2.open),
+        (b"\xfd7zXZ\x00", lzma.open),
+    )
+
+    # number of bytes (or characters, for text sources) read at a time in streaming mode
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, fobj=None, url=None, stream=False, chunk_size=CHUNK_SIZE, mapped=False, cache=None,
+                 sock=None):
+        """Initializes an input stream from a file object, a local path, a URL, a socket, or standard input.
+
+        By default the whole input is read up front. With stream=True the input is read in chunks of
+        chunk_size and tokens are produced lazily, so memory use does not grow with the size of the input.
+        With mapped=True a local file is memory-mapped and tokens are split out of successive slices of
+        chunk_size mapped bytes; opening takes constant time and memory, and the mapping is kept in
+        self.buffer for random access. In streaming and mapped mode tokens are split on ASCII whitespace for
+        binary sources, and the line and character readers raise io.UnsupportedOperation.
+
+        Binary sources compressed with gzip, bzip2 or xz are recognized by their magic bytes and
+        decompressed on the fly. A compressed source is always streamed, so it is never decompressed into
+        memory as a whole; its line and character readers are not available.
+
+        A socket is always read incrementally: data is received with recv_into into a reusable buffer of
+        chunk_size bytes only when more tokens are needed, so a fast producer is held back by TCP flow
+        control instead of filling memory.
+
+        :param fobj: file object to read from, in text or binary mode, or the path of a local file.
+        :param url: URL to read from.
+        :param stream: if True, tokenize the input incrementally instead of reading it all at once.
+        :param chunk_size: size of the chunks read in streaming mode.
+        :param mapped: if True, memory-map the local file given by fobj.
+        :param cache: a URLCache; if given, the URL is read from its local copy in the cache.
+        :param sock: a connected socket, or a (host, port) pair to connect to.
+        """
+        self.lines = []
+        self.content = ""
+        self.scanned_contents = []
+        self.path = None
+        self.buffer = None
+        self._index = None
+        self._peeked = None
+        # the whole input is read up front, so the line and character readers are available
+        self._eager = False
+        # state of the scanner of a local file or memory map, see _scan
+        self._source = None
+        self._batch = iter(())
+        self._carry = None
+
+        if isinstance(fobj, (str, os.PathLike)):
+            self.path = os.fspath(fobj)
+            self.fopen = open(self.path, "rb")
+        elif fobj is not None:
             self.fopen = fobj
-            self.lines = self.fopen.readlines()
-            self.content = "".join(self.lines)
-            self.scanned_contents = re.split(self.WHITESPACE_PATTERN, self.content)
-
-        try:
-            self.fopen = urllib.request.urlopen(url)
-        except ValueError as e:
-            raise e
+        elif sock is not None:
+            if not isinstance(sock, socket.socket):
+                sock = socket.create_connection(sock)
+            self.fopen = sock
+            stream, mapped = True, False
+        elif url is not None and cache is not None:
+            self.fopen = cache.fetchFile(url)
+            self.path = self.fopen.name
+        elif url is not None:
+            try:
+                self.fopen = urllib.request.urlopen(url)
+            except ValueError as e:
+                raise e
+        else:
+            self.fopen = sys.stdin
+
+        self._raw = self.fopen
+        self.fopen = self._decompressed(self.fopen)
+        if self.fopen is not self._raw:
+            mapped, stream = False, True
+
+        if mapped:
+            self.buffer = self._map()
+            self._source = self._slices(chunk_size)
+            self._tokens = self._scan()
+        elif isinstance(self.fopen, socket.socket):
+            self._tokens = _scan_tokens(self._received(chunk_size))
+        elif stream and self.path is not None:
+            self._source = self._chunks(chunk_size)
+            self._tokens = self._scan()
+        elif stream:
+            self._tokens = _scan_tokens(self._chunks(chunk_size))
         else:
-            self.lines= self.fopen.readlines()
+            self._eager = True
+            self.lines = [self._decode(line) for line in self.fopen.readlines()]
             self.content = "".join(self.lines)
             self.scanned_contents = re.split(self.WHITESPACE_PATTERN, self.content)
+            self._tokens = (token for token in self.scanned_contents if token)
+
+    def _decompressed(self, fobj):
+        """Returns a decompressing reader over fobj if it starts with the magic bytes of a compressed format,
+        and fobj itself otherwise. Only sources that can peek at their first bytes are inspected."""
+        peek = getattr(fobj, "peek", None)
+        if peek is None:
+            return fobj
+        head = peek(6)
+        if not isinstance(head, bytes):
+            return fobj
+        for magic, opener in self.COMPRESSED_FORMATS:
+            if head.startswith(magic):
+                return opener(fobj, "rb")
+        return fobj
+
+    def _map(self):
+        """Returns a read-only memory map of the underlying file, or empty bytes for an empty file."""
+        fileno = self.fopen.fileno()
+        if os.fstat(fileno).st_size == 0:
+            return b""
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+    def _chunks(self, chunk_size):
+        """Yields successive chunks of the underlying stream until it is exhausted."""
+        read = self.fopen.read
+        chunk = read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = read(chunk_size)
+
+    def _slices(self, chunk_size):
+        """Yields successive slices of chunk_size bytes of the memory map."""
+        buffer = self.buffer
+        for start in range(0, len(buffer), chunk_size):
+            yield buffer[start:start + chunk_size]
+
+    def _scan(self):
+        """Splits the chunks of self._source into tokens, like _scan_tokens, but keeps the unread tokens of
+        the current chunk and the carry in this object, so _remaining_token_list can take over the rest of
+        the input in bulk."""
+        for chunk in self._source:
+            tokens, self._carry = _split_chunk(self._carry, chunk)
+            self._batch = iter(tokens)
+            yield from self._batch
+        if self._carry:
+            carry, self._carry = self._carry, None
+            yield carry
+
+    def _received(self, buffer_size):
+        """Yields the data received from the underlying socket, one recv_into of at most buffer_size bytes
+        at a time, until the peer closes the connection."""
+        received = bytearray(buffer_size)
+        with memoryview(received) as view:
+            n = self.fopen.recv_into(view)
+            while n:
+                yield bytes(view[:n])
+                n = self.fopen.recv_into(view)
+
+    def _decode(self, s):
+        """Returns s as a str, decoding it with CHARSET_NAME if it is bytes."""
+        if isinstance(s, bytes):
+            return s.decode(self.CHARSET_NAME)
+        return s
+
+    def _next_token(self, kind):
+        """Returns the next raw token, or raises NoSuchElementException naming the requested kind of value."""
+        if self._peeked is not None:
+            token, self._peeked = self._peeked, None
+            return token
+        try:
+            return next(self._tokens)
+        except StopIteration:
+            raise NoSuchElementException("attempts to read a '" + kind + "' value from the input stream, "
+                                         + "but no more tokens are available") from None
+
+    def _remaining_tokens(self):
+        """Returns an iterator over all remaining raw tokens. Abandoning it part way leaves the rest of the
+        tokens to the other readers."""
+        if self._peeked is None:
+            return self._tokens
+        token, self._peeked = self._peeked, None
+        return itertools.chain((token,), self._tokens)
+
+    def _remaining_token_list(self):
+        """Returns a list of all remaining raw tokens. The rest of a local file or memory map is read in one
+        step and split with a single bytes.split, instead of token by token."""
+        if self._source is None:
+            return list(self._remaining_tokens())
+        tokens = [] if self._peeked is None else [self._peeked]
+        self._peeked = None
+        tokens.extend(self._batch)
+        rest = b"".join(self._source)
+        if self._carry:
+            rest = self._carry + rest
+            self._carry = None
+        tokens.extend(rest.split())
+        self._tokens = iter(())
+        return tokens
+
+    def isEmpty(self) -> bool:
+        """Returns true if this input stream has no more tokens.
+
+        :return: True if no more tokens are available, False otherwise.
+        """
+        if self._peeked is None:
+            self._peeked = next(self._tokens, None)
+        return self._peeked is None
+
+    def _require_eager(self, kind):
+        """Raises io.UnsupportedOperation unless the whole input was read up front."""
+        if not self._eager:
+            raise io.UnsupportedOperation("attempts to read " + kind + " from an input stream in streaming, "
+                                          + "mapped or socket mode")
 
     def readline(self):
         """Reads and returns the next line in this input stream.
 
+        @throws io.UnsupportedOperation in streaming, mapped or socket mode
         :return: the next line in this input stream; None if no such line
         """
-        try:
-            for line in self.lines:
-                yield line
-        except StopIteration:
-            return None
+        self._require_eager("a line")
+        return iter(self.lines)
 
     def exists(self) -> bool:
         """
@@ -99,33 +481,38 @@ class In:
     def readChar(self) -> int:
         """Reads and returns the next character in this input stream.
 
+        @throws io.UnsupportedOperation in streaming, mapped or socket mode
         :return: the next in this input stream, throws ValueError if the input stream is empty.
         """
-        try:
-            for _char in self.content:
-                yield _char
-        except StopIteration:
-            raise ValueError("attempts to read a 'char' value from the input stream, but no more tokens are available")
+        self._require_eager("a 'char' value")
+        return iter(self.content)
 
     def readAll(self) -> str:
         """
-        Reads and returns the remainder of this input stream, as a string.
+        Reads and returns the remainder of this input stream, as a string. The text after the last token
+        read is returned, and no tokens are left.
 
-        :return:
+        @throws io.UnsupportedOperation in streaming, mapped or socket mode
+        :return: the remaining text
         """
-        result = self.fopen.read()
-        return result
+        self._require_eager("the remaining text")
+        remaining = len(self.readAllStrings())
+        if remaining == 0:
+            return ""
+        # the remaining tokens are the last ones of the content; keep the text from the first of them on
+        parts = self.content.rsplit(None, remaining)
+        if len(parts) == remaining:
+            return self.content
+        return self.content[len(parts[0]):]
 
 
     def readString(self) -> str:
         """Reads the next token from this input stream and returns it as a String.
 
+        @throws NoSuchElementException if the input stream is empty
         :return: str
         """
-        try:
-            yield self.readline()
-        except StopIteration:
-            raise ValueError("attempts to read a 'String' value from the input stream, but no more tokens are available")
+        return self._decode(self._next_token("String"))
 
     def readInt(self) -> int:
         """Reads the next token from this input stream, parses it as a int,
@@ -135,18 +522,12 @@ class In:
         @throws InputMismatchException if the next token cannot be parsed as an int
         :return: the next int in this input stream
         """
-
-        if not self.scanned_contents:
-            raise NoSuchElementException("attemps to read an 'int' value from the input stream, "
-                                         + "but no more tokens are available")
-
-        for token in self.scanned_contents:
-            try:
-                yield int(token)
-            except ValueError:
-                raise InputMismatchException("attempts to read an 'int' value from the input stream, "
-                                             + "but the next token is \"" + token + "\"")
-
+        token = self._next_token("int")
+        try:
+            return int(token)
+        except ValueError:
+            raise InputMismatchException("attempts to read an 'int' value from the input stream, "
+                                         + "but the next token is \"" + self._decode(token) + "\"") from None
 
     def readDouble(self) -> float:
         """Reads the next token from this input stream, parses it as a float,
@@ -156,17 +537,12 @@ class In:
         @throws InputMismatchException if the next token cannot be parsed as an int
         :return: the next int in this input stream
         """
-
-        if not self.scanned_contents:
-            raise NoSuchElementException("attemps to read an 'float' value from the input stream, "
-                                         + "but no more tokens are available")
-
-        for token in self.scanned_contents:
-            try:
-                yield float(token)
-            except ValueError:
-                raise InputMismatchException("attempts to read an 'int' value from the input stream, "
-                                             + "but the next token is \"" + token + "\"")
+        token = self._next_token("float")
+        try:
+            return float(token)
+        except ValueError:
+            raise InputMismatchException("attempts to read a 'float' value from the input stream, "
+                                         + "but the next token is \"" + self._decode(token) + "\"") from None
 
     def readFloat(self) -> float:
         """Reads the next token from this input stream, parses it as a float,
@@ -210,16 +586,10 @@ class In:
         @throws InputMismatchException if the next token cannot be parsed as a {@code byte}
         :return:
         """
-        if not self.scanned_contents:
-            raise NoSuchElementException("attemps to read an 'byte' value from the input stream, "
-                                         + "but no more tokens are available")
-
-        for token in self.scanned_contents:
-            try:
-                yield bytes(token, encoding=self.CHARSET_NAME)
-            except ValueError:
-                raise InputMismatchException("attempts to read an 'byte' value from the input stream, "
-                                             + "but the next token is \"" + token + "\"")
+        token = self._next_token("byte")
+        if isinstance(token, bytes):
+            return token
+        return bytes(token, encoding=self.CHARSET_NAME)
 
 
     def readAllStrings(self) -> list:
@@ -227,15 +597,16 @@ class In:
 
         :return: all remaining tokens in this input stream, as an array of strings
         """
-        return re.split(self.WHITESPACE_PATTERN, self.content)
+        return [self._decode(token) for token in self._remaining_tokens()]
 
     def readAllLines(self) -> str:
         """
         Reads and returns all the lines of hte input.
 
+        @throws io.UnsupportedOperation in streaming, mapped or socket mode
         :return: List of Lines.
         """
-
+        self._require_eager("lines")
         return self.lines
 
     def readAllInts(self) -> Iterator[int]:
@@ -244,8 +615,7 @@ class In:
 
         :return: all remaining lines in this input stream, as an array of integers
         """
-        tokens = self.readAllStrings()
-        return list(map(int, tokens))
+        return list(map(int, self._remaining_tokens()))
 
     def readAllLongs(self) -> Iterator[int]:
         """Reads all remaining tokens from this input stream, parses them as longs, and returns them as an
@@ -261,12 +631,262 @@ class In:
 
         :return: All remaining lines in this input stream, as an array of doubles
         """
-        tokens = self.readAllStrings()
-        return list(map(float, tokens))
+        return list(map(float, self._remaining_tokens()))
+
+    def readAllIntsArray(self, use_numpy=True):
+        """Reads all remaining tokens from this input stream and parses them into a contiguous buffer of
+        64-bit integers.
+
+        The rest of a local file or memory map is split in one step, and the tokens are parsed straight into
+        the buffer, so no intermediate list of Python ints is built. If NumPy is installed and use_numpy is
+        True, the tokens are parsed by NumPy in bulk into a numpy.ndarray of dtype int64, otherwise into an
+        array('q').
+
+        @throws ValueError if a token cannot be parsed as an int
+        :param use_numpy: return a NumPy array when NumPy is available.
+        :return: all remaining tokens in this input stream, as a typed array of integers
+        """
+        tokens = self._remaining_token_list()
+        if use_numpy and numpy is not None:
+            return numpy.array(tokens, dtype=numpy.int64)
+        return array("q", map(int, tokens))
+
+    def readAllDoublesArray(self, use_numpy=True):
+        """Reads all remaining tokens from this input stream and parses them into a contiguous buffer of
+        doubles.
+
+        The rest of a local file or memory map is split in one step. If NumPy is installed and use_numpy is
+        True, the tokens are parsed by NumPy in bulk into a numpy.ndarray of dtype float64, otherwise into an
+        array('d').
+
+        @throws ValueError if a token cannot be parsed as a float
+        :param use_numpy: return a NumPy array when NumPy is available.
+        :return: all remaining tokens in this input stream, as a typed array of doubles
+        """
+        tokens = self._remaining_token_list()
+        if use_numpy and numpy is not None:
+            return numpy.array(tokens, dtype=numpy.float64)
+        return array("d", map(float, tokens))
+
+    def readEdges(self):
+        """Reads an edge list in the standard algs4 layout: the number of vertices V, the number of edges E,
+        and E triples of two ints (the endpoints) followed by a double (the weight).
+
+        The edges are parsed in one pass straight into three typed columns, without creating a Python
+        object per edge.
+
+        @throws NoSuchElementException if the input stream ends before E edges are read
+        @throws InputMismatchException if a token cannot be parsed as an int or a double, or an endpoint does
+                not fit in a 32-bit int
+        :return: a tuple (V, E, tails, heads, weights), where tails and heads are array('i') and weights
+                 is an array('d')
+        """
+        V = self.readInt()
+        E = self.readInt()
+        tails, heads, weights = array("i"), array("i"), array("d")
+        addTail, addHead, addWeight = tails.append, heads.append, weights.append
+        nextToken = self._remaining_tokens().__next__
+        try:
+            for e in range(E):
+                addTail(int(nextToken()))
+                addHead(int(nextToken()))
+                addWeight(float(nextToken()))
+        except StopIteration:
+            raise NoSuchElementException("attempts to read " + str(E) + " edges from the input stream, "
+                                         + "but only " + str(len(weights)) + " are available") from None
+        except (ValueError, OverflowError) as e:
+            raise InputMismatchException("attempts to read edge " + str(len(weights)) + " from the input "
+                                         + "stream, but " + str(e)) from None
+        return V, E, tails, heads, weights
+
+    def readAllIntsParallel(self, processes=None):
+        """Parses all tokens of the underlying local file as integers, using a pool of worker processes.
+
+        The file is split into byte ranges aligned to whitespace, each range is parsed by a worker, and the
+        results are concatenated in file order, so the output is identical to readAllIntsArray(use_numpy=False)
+        on a freshly opened input stream. The whole file is parsed, regardless of tokens already read, and the
+        input stream is exhausted afterwards.
+
+        @throws ValueError if this input stream was not opened from a local path
+        :param processes: number of worker processes, os.cpu_count() by default.
+        :return: all tokens in the file, as an array('q')
+        """
+        return self._parse_parallel("q", processes)
+
+    def readAllDoublesParallel(self, processes=None):
+        """Parses all tokens of the underlying local file as doubles, using a pool of worker processes.
+
+        See readAllIntsParallel.
+
+        @throws ValueError if this input stream was not opened from a local path
+        :param processes: number of worker processes, os.cpu_count() by default.
+        :return: all tokens in the file, as an array('d')
+        """
+        return self._parse_parallel("d", processes)
+
+    def _split_ranges(self, parts):
+        """Splits the local file into at most parts byte ranges that each start and end on whitespace."""
+        size = os.path.getsize(self.path)
+        bounds = [0]
+        with open(self.path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+            try:
+                for i in range(1, parts):
+                    offset = max(size * i // parts, bounds[-1])
+                    match = self.BYTE_WHITESPACE_PATTERN.search(data, offset)
+                    if match is None:
+                        break
+                    if match.start() > bounds[-1]:
+                        bounds.append(match.start())
+            finally:
+                if size:
+                    data.close()
+        bounds.append(size)
+        return list(zip(bounds, bounds[1:]))
+
+    def _parse_parallel(self, typecode, processes):
+        if self.path is None or self.fopen is not self._raw:
+            raise ValueError("parallel parsing requires an input stream opened from an uncompressed local path")
+        processes = processes or os.cpu_count() or 1
+        # a few ranges per worker keep the pool busy when token density varies across the file
+        ranges = self._split_ranges(processes * 4 if processes > 1 else 1)
+        result = array(typecode)
+        if processes == 1:
+            for start, end in ranges:
+                result += _parse_range(self.path, start, end, typecode)
+        else:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = [executor.submit(_parse_range, self.path, start, end, typecode) for start, end in ranges]
+                for future in futures:
+                    result += future.result()
+        self._tokens = iter(())
+        self._peeked = None
+        return result
+
+    def lineIndex(self, rebuild=False, index_path=None):
+        """Returns the persistent line index of the underlying local file, building its sidecar file on
+        first use. See LineIndex.
+
+        @throws ValueError if this input stream was not opened from an uncompressed local path
+        :param rebuild: if True, rebuild the sidecar index.
+        :param index_path: path of the sidecar index, for instance in a writable directory when the file is
+                           in a read-only one; path + ".idx" by default.
+        :return: the LineIndex
+        """
+        if self.path is None or self.fopen is not self._raw:
+            raise ValueError("a line index requires an input stream opened from an uncompressed local path")
+        if self._index is None or rebuild or index_path is not None and index_path != self._index.index_path:
+            if self._index is not None:
+                self._index.close()
+            self._index = LineIndex(self.path, index_path=index_path, rebuild=rebuild)
+        return self._index
+
+    def readLineAt(self, n) -> str:
+        """Reads line n of the underlying local file in constant time, using its line index. This does not
+        move the position of the other readers.
+
+        @throws IndexError if the file has no line n
+        :param n: the line number, starting at 0.
+        :return: line n, excluding the line separator
+        """
+        return self._decode(self.lineIndex().readLine(n))
+
+    def readRange(self, start, end) -> bytes:
+        """Reads the bytes in the range [start, end) of the underlying local file, directly and without a
+        line index. This does not move the position of the other readers.
+
+        @throws ValueError if this input stream was not opened from an uncompressed local path
+        :return: the bytes
+        """
+        if self.path is None or self.fopen is not self._raw:
+            raise ValueError("a byte range requires an input stream opened from an uncompressed local path")
+        if hasattr(os, "pread"):
+            return os.pread(self._raw.fileno(), end - start, start)
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            return f.read(end - start)
 
     def close(self):
         """Close the stream.
 
         :return: None.
         """
+        if self._index is not None:
+            self._index.close()
+        # drop the token scanner first, it holds a reference into the memory map
+        self._tokens = iter(())
+        self._peeked = None
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
         self.fopen.close()
+        if self._raw is not self.fopen:
+            self._raw.close()
+
+
+if __name__ == '__main__':
+    # % python In.py largeEWD.txt
+    # Compares a full token scan of the eager reader against the streaming and memory-mapped readers.
+    import time
+    import tracemalloc
+
+    for mode in ("eager", "stream", "mapped"):
+        tracemalloc.start()
+        start = time.perf_counter()
+        inp = In(sys.argv[1], stream=mode == "stream", mapped=mode == "mapped")
+        tokens = 0
+        while not inp.isEmpty():
+            inp.readDouble()
+            tokens += 1
+        inp.close()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("{mode}: {tokens} tokens in {elapsed:.3f}s, peak memory {peak} bytes".format(
+            mode=mode, tokens=tokens, elapsed=elapsed, peak=peak))
+
+    # Speedup of the parallel double parser over the serial one, per number of worker processes.
+    inp = In(sys.argv[1])
+    start = time.perf_counter()
+    expected = inp.readAllDoublesArray(use_numpy=False)
+    serial = time.perf_counter() - start
+    inp.close()
+    processes = 1
+    while processes <= (os.cpu_count() or 1):
+        inp = In(sys.argv[1])
+        start = time.perf_counter()
+        values = inp.readAllDoublesParallel(processes)
+        elapsed = time.perf_counter() - start
+        inp.close()
+        assert values == expected
+        print("parallel, {processes} processes: {elapsed:.3f}s, speedup {speedup:.2f}x".format(
+            processes=processes, elapsed=elapsed, speedup=serial / elapsed))
+        processes *= 2
+
+    # Streaming decompression compared with decompressing to a temporary file and reading that.
+    import shutil
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix, opener in ((".gz", gzip.open), (".bz2", bz2.open), (".xz", lzma.open)):
+            compressed = os.path.join(tmp, "input" + suffix)
+            with open(sys.argv[1], "rb") as src, opener(compressed, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+
+            start = time.perf_counter()
+            inp = In(compressed, stream=True)
+            streamed = inp.readAllDoublesArray(use_numpy=False)
+            inp.close()
+            direct = time.perf_counter() - start
+
+            start = time.perf_counter()
+            plain = os.path.join(tmp, "input.txt")
+            with opener(compressed, "rb") as src, open(plain, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            inp = In(plain, stream=True)
+            values = inp.readAllDoublesArray(use_numpy=False)
+            inp.close()
+            two_step = time.perf_counter() - start
+
+            assert values == streamed
+            print("{suffix}: streaming {direct:.3f}s, decompress then read {two_step:.3f}s".format(
+                suffix=suffix, direct=direct, two_step=two_step))
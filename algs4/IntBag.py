@@ -0,0 +1,116 @@
+"""
+The IntBag class represents a bag (or multiset) of integers, such as the neighbor ids of a vertex. It supports
+insertion and iterating over the items in arbitrary order.
+
+This implementation stores the items unboxed in an array.array of typecode "i" (C int) or "q" (C long long)
+and declares __slots__, so an item takes 4 or 8 bytes instead of a pointer to a Python int object. The items
+can be added from any object supporting the buffer protocol, such as an array or a numpy array, and exported
+as a memoryview for handing the adjacency list to vectorized code without copying. The bag cannot grow while
+an exported memoryview is alive.
+
+The <em>add</em> operation takes constant amortized time; the <em>isEmpty</em> and <em>size</em> operations take
+constant time. Iteration takes time proportional to the number of items.
+
+For additional documentation, see <a href="https://algs4.cs.princeton.edu/13stacks">Section 1.3</a> of
+<i>Algorithms, 4th Edition</i> by Robert Sedgewick and Kevin Wayne.
+
+% python IntBag.py
+"""
+
+from array import array
+
+
+class IntBag:
+
+    __slots__ = ("items",)
+
+    def __init__(self, typecode="i"):
+        """Initializes an empty bag.
+
+        :param typecode: "i" for 32-bit or "q" for 64-bit items.
+        """
+        if typecode not in ("i", "q"):
+            raise ValueError("Typecode must be 'i' or 'q'.")
+        self.items = array(typecode)
+
+    def isEmpty(self):
+        """Returns true if this bag is empty.
+
+        :return: True if bag is empty, False otherwise.
+        """
+        return not self.items
+
+    def size(self):
+        """Returns the number of items in this bag.
+
+        :return: the number of items in this bag
+        """
+        return len(self.items)
+
+    def add(self, item):
+        """Adds the item to this bag.
+
+        @throws OverflowError if the item does not fit the typecode
+        :param item: the integer to add to this bag
+        :return: None
+        """
+        self.items.append(item)
+
+    def extend(self, items):
+        """Adds all the items of an iterable to this bag. A contiguous buffer of the same item type, such as
+        an array or a numpy array of C ints for typecode "i", is copied in a single step.
+
+        @throws OverflowError if an item does not fit the typecode
+        :param items: the integers to add to this bag
+        :return: None
+        """
+        try:
+            view = memoryview(items)
+        except TypeError:
+            self.items.extend(items)
+            return
+        with view:
+            if view.format == self.items.typecode and view.c_contiguous:
+                self.items.frombytes(view.cast("B"))
+            else:
+                self.items.extend(view.tolist())
+
+    def view(self):
+        """Returns a read-only memoryview of the items, without copying them. Release it before adding to
+        this bag.
+
+        :return: memoryview of the items, with format "i" or "q"
+        """
+        return memoryview(self.items).toreadonly()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __str__(self):
+        return " ".join(str(item) for item in self.items)
+
+
+if __name__ == '__main__':
+    # Compares the memory per vertex of ResizingArrayBag and IntBag adjacency lists of vertex ids.
+    import random
+    import tracemalloc
+
+    from ResizingArrayBag import ResizingArrayBag
+
+    V = 100000
+    for degree in (4, 16):
+        neighbors = [random.randrange(1000, V) for i in range(V * degree)]
+        for cls in (ResizingArrayBag, IntBag):
+            tracemalloc.start()
+            adj = [cls() for v in range(V)]
+            for v, bag in enumerate(adj):
+                for i in range(v * degree, (v + 1) * degree):
+                    bag.add(int(str(neighbors[i])))     # a fresh int object, as when parsed from input
+            used = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del adj
+            print("{name}, degree {degree}: {bytes:.1f} bytes per vertex".format(
+                name=cls.__name__, degree=degree, bytes=used / V))
@@ -0,0 +1,251 @@
+"""
+The QuantileSketch class is a data type for estimating quantiles, such as the median or the 99th
+percentile, of a stream of real numbers in bounded memory. It is a companion to Accumulator, with
+the same addDataValue, addDataValues, count and merge operations.
+
+This implementation is a merging t-digest. The data values are summarized by centroids, each a mean
+and a weight, kept sorted by mean. New values are collected in a buffer, and when it is full the
+buffer and the centroids are sorted together and merged greedily, subject to a size limit given by
+the scale function k(q) = compression / (2 pi) * asin(2q - 1): a centroid may span at most one unit
+of k. Centroids near the median may grow large, while those near the tails stay small, so extreme
+quantiles are estimated with a small relative error. A quantile is estimated by interpolating
+between the means of neighboring centroids.
+
+The compression parameter trades accuracy against memory: the sketch keeps at most about compression
+centroids, typically 0.6 * compression, and the error decreases roughly in proportion to 1 / compression.
+Sketches of disjoint data sets can be merged, and a sketch pickles as its centroids.
+
+This technique is due to
+<a href = "https://arxiv.org/abs/1902.04023">T. Dunning and O. Ertl</a>.
+
+% python QuantileSketch.py
+"""
+
+import math
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class QuantileSketch:
+
+    __slots__ = ("compression", "n", "min", "max", "means", "weights", "buffer", "bufferSize")
+
+    def __init__(self, compression=100):
+        """Initializes an empty sketch.
+
+        :param compression: the accuracy parameter; at most about compression centroids are kept, typically
+                            0.6 * compression.
+        """
+        if compression < 10:
+            raise ValueError("Compression must be at least 10.")
+        self.compression = compression
+        self.n = 0                              # number of data values, including the buffered ones
+        self.min = math.inf                     # smallest data value
+        self.max = -math.inf                    # largest data value
+        self.means = array("d")                 # centroid means, in increasing order
+        self.weights = array("d")               # centroid weights
+        self.buffer = []                        # data values not yet merged into the centroids
+        self.bufferSize = 5 * compression
+
+    def __getstate__(self):
+        self._compress()
+        return self.compression, self.n, self.min, self.max, self.means, self.weights
+
+    def __setstate__(self, state):
+        self.compression, self.n, self.min, self.max, self.means, self.weights = state
+        self.buffer = []
+        self.bufferSize = 5 * self.compression
+
+    def addDataValue(self, x):
+        """Adds a data value.
+
+        :param x: the data value.
+        :return: None
+        """
+        self.buffer.append(x)
+        self.n += 1
+        if len(self.buffer) >= self.bufferSize:
+            self._compress()
+
+    def addDataValues(self, values):
+        """Adds a batch of data values.
+
+        :param values: a list, an array, a NumPy array, or an iterable of real numbers.
+        :return: None
+        """
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            values = values.ravel().tolist()
+        elif not isinstance(values, (list, tuple, array)):
+            values = list(values)
+        i = 0
+        while i < len(values):
+            end = i + self.bufferSize - len(self.buffer)
+            self.buffer.extend(values[i:end])
+            self.n += len(values[i:end])
+            i = end
+            if len(self.buffer) >= self.bufferSize:
+                self._compress()
+
+    def _compress(self):
+        """Merges the buffered data values into the centroids."""
+        if not self.buffer:
+            return
+        buffer = self.buffer
+        self.buffer = []
+        buffer.sort()
+        self.min = min(self.min, buffer[0])
+        self.max = max(self.max, buffer[-1])
+        if self.means:
+            centroids = sorted(zip(list(self.means) + buffer, list(self.weights) + [1.0] * len(buffer)))
+        else:
+            centroids = zip(buffer, [1.0] * len(buffer))
+        self._merge(centroids, self.n)
+
+    def _merge(self, centroids, total):
+        """Replaces the centroids by a greedy merge of the given (mean, weight) pairs, sorted by mean."""
+        normalizer = self.compression / (2 * math.pi)
+        kMax = self.compression / 4
+        means, weights = array("d"), array("d")
+
+        centroids = iter(centroids)
+        mean, weight = next(centroids)
+        merged = 0.0            # total weight of the finished centroids
+        limit = total * self._limit(0.0, normalizer, kMax)
+        for x, w in centroids:
+            if merged + weight + w <= limit:
+                weight += w
+                mean += (x - mean) * w / weight
+            else:
+                means.append(mean)
+                weights.append(weight)
+                merged += weight
+                limit = total * self._limit(merged / total, normalizer, kMax)
+                mean, weight = x, w
+        means.append(mean)
+        weights.append(weight)
+        self.means, self.weights = means, weights
+
+    @staticmethod
+    def _limit(q, normalizer, kMax):
+        """Returns the largest quantile that a centroid starting at quantile q may reach, k(q) + 1."""
+        k = normalizer * math.asin(2 * q - 1) + 1
+        if k >= kMax:
+            return 1.0
+        return (math.sin(k / normalizer) + 1) / 2
+
+    def count(self):
+        """Returns the number of data values.
+
+        :return: Total number of data values.
+        """
+        return self.n
+
+    def size(self):
+        """Returns the number of centroids, a measure of the memory used by this sketch.
+
+        :return: the number of centroids.
+        """
+        self._compress()
+        return len(self.means)
+
+    def quantile(self, q):
+        """Returns an estimate of the q-quantile of the data values.
+
+        @throws ValueError unless {@code 0 <= q <= 1}
+        :param q: the quantile, for instance 0.99 for the 99th percentile.
+        :return: the estimated quantile, or nan if there are no data values.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("Quantile must be between 0 and 1.")
+        self._compress()
+        means, weights = self.means, self.weights
+        if not means:
+            return math.nan
+        if len(means) == 1:
+            return means[0]
+
+        # the weight of each centroid is spread around its mean, half below and half above
+        index = q * self.n
+        if index <= weights[0] / 2:
+            return self.min + (means[0] - self.min) * index / (weights[0] / 2)
+        cumulative = weights[0] / 2
+        for i in range(len(means) - 1):
+            step = (weights[i] + weights[i + 1]) / 2
+            if cumulative + step >= index:
+                return means[i] + (means[i + 1] - means[i]) * (index - cumulative) / step
+            cumulative += step
+        last = weights[-1] / 2
+        return means[-1] + (self.max - means[-1]) * min(1.0, (index - cumulative) / last)
+
+    def merge(self, other):
+        """Adds the data values summarized by another sketch to this one. The other sketch is not changed.
+
+        :param other: the sketch to merge into this one.
+        :return: None
+        """
+        self._compress()
+        other._compress()
+        if not other.means:
+            return
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        centroids = sorted(zip(list(self.means) + list(other.means), list(self.weights) + list(other.weights)))
+        self._merge(centroids, self.n)
+
+    @classmethod
+    def combine(cls, sketches, compression=100):
+        """Returns a new sketch of the data values summarized by all the given sketches.
+
+        :param sketches: iterable of sketches.
+        :param compression: the accuracy parameter of the new sketch.
+        :return: the combined sketch.
+        """
+        result = cls(compression)
+        for other in sketches:
+            result.merge(other)
+        return result
+
+    def __str__(self):
+        """String representation of the sketch.
+
+        :return: string representation of the sketch
+        """
+        return "n = " + str(self.n) + ", median = " + str(self.quantile(0.5)) + \
+               ", p99 = " + str(self.quantile(0.99))
+
+
+if __name__ == '__main__':
+    # Updates per second and error against exact sorting on a million lognormal latency samples. The rank
+    # error is the difference between q and the fraction of the samples below the estimated q-quantile.
+    import bisect
+    import random
+    import time
+
+    N = 1000000
+    samples = [random.lognormvariate(0.0, 1.0) for i in range(N)]
+    exact = sorted(samples)
+
+    for compression in (50, 100, 200, 500):
+        sketch = QuantileSketch(compression)
+        start = time.perf_counter()
+        for x in samples[:N // 10]:
+            sketch.addDataValue(x)
+        single = N // 10 / (time.perf_counter() - start)
+
+        sketch = QuantileSketch(compression)
+        start = time.perf_counter()
+        sketch.addDataValues(samples)
+        batch = N / (time.perf_counter() - start)
+
+        print("compression {}: {} centroids, {:.0f} updates/s, {:.0f} batched updates/s".format(
+            compression, sketch.size(), single, batch))
+        for q in (0.5, 0.99, 0.999):
+            estimate = sketch.quantile(q)
+            expected = exact[min(N - 1, int(q * N))]
+            print("    q = {}: relative error {:.3%}, rank error {:.4%}".format(
+                q, abs(estimate - expected) / expected, abs(bisect.bisect(exact, estimate) / N - q)))
@@ -13,8 +13,8 @@ class NoSuchElementException(ValueError):
 
 
 class Node:
-    def __init__(self):
-        self.item = None
+    def __init__(self, item=None):
+        self.item = item
         self.next = None
 
     def __str__(self):
@@ -89,6 +89,61 @@ class Queue:
 
         return item
 
+    def enqueueMany(self, items):
+        """Adds all the items of an iterable to this queue, in order.
+
+        The new nodes are linked to each other first, and the chain is attached to the end of the queue in
+        one step.
+
+        :param items: iterable of items to add to the queue.
+        :return: None
+        """
+        first = last = None
+        count = 0
+        for item in items:
+            node = Node(item)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+
+        if first is None:
+            return
+        if self.isEmpty():
+            self.first = first
+        else:
+            self.last.next = first
+        self.last = last
+        self.n += count
+
+    def dequeueMany(self, k):
+        """Removes and returns the k items on this queue that were least recently added, or all the items
+        if there are fewer than k.
+
+        :param k: maximum number of items to remove.
+        :return: list of the removed items, least recently added first
+        """
+        items = []
+        node = self.first
+        while node is not None and len(items) < k:
+            items.append(node.item)
+            node = node.next
+
+        self.first = node
+        self.n -= len(items)
+        if self.isEmpty():
+            self.last = None
+        return items
+
+    def drain(self):
+        """Removes and returns all the items on this queue.
+
+        :return: list of the items, least recently added first
+        """
+        return self.dequeueMany(self.n)
+
     def __iter__(self):
         self.itern = self.n
         return self
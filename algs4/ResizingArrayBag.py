@@ -0,0 +1,82 @@
+"""
+The ResizingArrayBag class represents a bag (or multiset) of generic items. It supports insertion and iterating
+over the items in arbitrary order.
+
+This implementation uses a resizing array, a Python list, and declares __slots__ so that an instance holds no
+per-object __dict__. It is used for the adjacency lists of the graph classes, where there is one bag per vertex
+and the fixed overhead of each bag adds up.
+
+The <em>add</em> operation takes constant amortized time; the <em>isEmpty</em> and <em>size</em> operations take
+constant time. Iteration takes time proportional to the number of items.
+
+For additional documentation, see <a href="https://algs4.cs.princeton.edu/13stacks">Section 1.3</a> of
+<i>Algorithms, 4th Edition</i> by Robert Sedgewick and Kevin Wayne.
+"""
+
+
+class ResizingArrayBag:
+
+    __slots__ = ("items",)
+
+    def __init__(self):
+        self.items = []
+
+    def isEmpty(self):
+        """Returns true if this bag is empty.
+
+        :return: True if bag is empty, False otherwise.
+        """
+        return not self.items
+
+    def size(self):
+        """Returns the number of items in this bag.
+
+        :return: the number of items in this bag
+        """
+        return len(self.items)
+
+    def add(self, item):
+        """Adds the item to this bag.
+
+        :param item: the item to add to this bag
+        :return: None
+        """
+        self.items.append(item)
+
+    def extend(self, items):
+        """Adds all the items of an iterable to this bag.
+
+        :param items: the items to add to this bag
+        :return: None
+        """
+        self.items.extend(items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __str__(self):
+        return " ".join(str(item) for item in self.items)
+
+
+if __name__ == '__main__':
+    # Compares the memory per vertex of Bag and ResizingArrayBag adjacency lists.
+    import tracemalloc
+
+    from Bag import Bag
+
+    V = 100000
+    for degree in (0, 1, 4):
+        for cls in (Bag, ResizingArrayBag):
+            tracemalloc.start()
+            adj = [cls() for v in range(V)]
+            for bag in adj:
+                for w in range(degree):
+                    bag.add(w)
+            used = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del adj
+            print("{name}, degree {degree}: {bytes:.1f} bytes per vertex".format(
+                name=cls.__name__, degree=degree, bytes=used / V))
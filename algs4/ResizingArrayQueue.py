@@ -0,0 +1,220 @@
+"""
+The ResizingArrayQueue class represents a first-in-first-out (FIFO) queue of generic items. It supports the
+usual enqueue and dequeue operations, along with methods for peeking at the first item, testing if the queue
+is empty, and iterating through the items in FIFO order.
+
+This implementation uses a resizing array as a circular buffer, doubled when it is full and halved when it is
+one-quarter full, and declares __slots__. Unlike the linked-list Queue, no node object is allocated per item.
+
+The enqueue and dequeue operations take constant amortized time. The size, peek, and is-empty operations take
+constant time in the worst case. Iteration does not modify the queue, and raises
+ConcurrentModificationException if the queue is modified while an iteration is in progress.
+
+For additional documentation, see <a href="https://algs4.cs.princeton.edu/13stacks">Section 1.3</a> of
+<i>Algorithms, 4th Edition</i> by Robert Sedgewick and Kevin Wayne.
+
+% python ResizingArrayQueue.py
+"""
+
+
+class NoSuchElementException(ValueError):
+    pass
+
+
+class ConcurrentModificationException(RuntimeError):
+    pass
+
+
+class ResizingArrayQueue:
+
+    __slots__ = ("q", "n", "first", "last", "modCount")
+
+    # initial capacity of the underlying array
+    INIT_CAPACITY = 8
+
+    def __init__(self):
+        self.q = [None] * self.INIT_CAPACITY   # queue elements
+        self.n = 0                              # number of elements on queue
+        self.first = 0                          # index of first element of queue
+        self.last = 0                           # index of next available slot
+        self.modCount = 0                       # number of modifications, for fail-fast iteration
+
+    def isEmpty(self):
+        """Returns true if this queue is empty.
+
+        :return: True if the queue is empty, False otherwise
+        """
+        return self.n == 0
+
+    def size(self):
+        """Return the number of items in this queue.
+
+        :return: n the number of items in this queue.
+        """
+        return self.n
+
+    def __len__(self):
+        return self.n
+
+    def _resize(self, capacity):
+        """Moves the items to a new array of the given capacity, with the first item at index 0."""
+        q, first, n = self.q, self.first, self.n
+        if first + n <= len(q):
+            items = q[first:first + n]
+        else:
+            items = q[first:] + q[:self.last]
+        items.extend([None] * (capacity - n))
+        self.q = items
+        self.first = 0
+        self.last = n % capacity
+
+    def peek(self):
+        """Returns the item least recently added to this queue.
+
+        :return: The item least recently added to the queue.
+        """
+        if self.n == 0:
+            raise NoSuchElementException("Queue underflow.")
+        return self.q[self.first]
+
+    def enqueue(self, item):
+        """Adds the item to this queue.
+
+        :param item:  Item to add to the queue.
+        :return: None
+        """
+        if self.n == len(self.q):
+            self._resize(2 * len(self.q))
+        self.q[self.last] = item
+        self.last += 1
+        if self.last == len(self.q):
+            self.last = 0
+        self.n += 1
+        self.modCount += 1
+
+    def dequeue(self):
+        """Removes and returns the item on this queue that was least recently added.
+
+        :return: the item on this queue that was least recently added
+        """
+        if self.n == 0:
+            raise NoSuchElementException("Queue underflow.")
+        q = self.q
+        item = q[self.first]
+        q[self.first] = None    # to avoid loitering
+        self.first += 1
+        if self.first == len(q):
+            self.first = 0
+        self.n -= 1
+        self.modCount += 1
+        if 0 < self.n == len(q) // 4 and len(q) > self.INIT_CAPACITY:
+            self._resize(len(q) // 2)
+        return item
+
+    def enqueueMany(self, items):
+        """Adds all the items of an iterable to this queue, in order.
+
+        The array is resized at most once, and the items are copied into it in at most two slices.
+
+        :param items: iterable of items to add to the queue.
+        :return: None
+        """
+        items = list(items)
+        k = len(items)
+        if k == 0:
+            return
+        if self.n + k > len(self.q):
+            capacity = len(self.q)
+            while capacity < self.n + k:
+                capacity *= 2
+            self._resize(capacity)
+
+        q, last = self.q, self.last
+        capacity = len(q)
+        head = min(k, capacity - last)
+        q[last:last + head] = items[:head]
+        q[:k - head] = items[head:]
+        self.last = (last + k) % capacity
+        self.n += k
+        self.modCount += 1
+
+    def dequeueMany(self, k):
+        """Removes and returns the k items on this queue that were least recently added, or all the items
+        if there are fewer than k.
+
+        :param k: maximum number of items to remove.
+        :return: list of the removed items, least recently added first
+        """
+        k = min(k, self.n)
+        if k <= 0:
+            return []
+
+        q, first = self.q, self.first
+        capacity = len(q)
+        head = min(k, capacity - first)
+        items = q[first:first + head] + q[:k - head]
+        q[first:first + head] = [None] * head   # to avoid loitering
+        q[:k - head] = [None] * (k - head)
+        self.first = (first + k) % capacity
+        self.n -= k
+        self.modCount += 1
+
+        if self.n == 0:
+            self.q = [None] * self.INIT_CAPACITY
+            self.first = self.last = 0
+        else:
+            while 0 < self.n <= capacity // 4 and capacity > self.INIT_CAPACITY:
+                capacity //= 2
+            if capacity != len(q):
+                self._resize(capacity)
+        return items
+
+    def drain(self):
+        """Removes and returns all the items on this queue.
+
+        :return: list of the items, least recently added first
+        """
+        return self.dequeueMany(self.n)
+
+    def __iter__(self):
+        """Iterates over the items in FIFO order, without removing them.
+
+        @throws ConcurrentModificationException if the queue is modified during the iteration
+        """
+        modCount = self.modCount
+        q, first = self.q, self.first
+        capacity = len(q)
+        for i in range(self.n):
+            if self.modCount != modCount:
+                raise ConcurrentModificationException("Queue modified during iteration.")
+            yield q[(first + i) % capacity]
+        if self.modCount != modCount:
+            raise ConcurrentModificationException("Queue modified during iteration.")
+
+    def __str__(self):
+        return " ".join(str(item) for item in self)
+
+
+if __name__ == '__main__':
+    # Compares a BFS-like workload against the linked-list Queue and collections.deque.
+    import collections
+    import time
+
+    from Queue import Queue
+
+    class Deque(collections.deque):
+        enqueue = collections.deque.append
+        dequeue = collections.deque.popleft
+
+    N = 1000000
+    for cls in (Queue, ResizingArrayQueue, Deque):
+        queue = cls()
+        start = time.perf_counter()
+        for i in range(N):
+            queue.enqueue(i)
+            queue.enqueue(i)
+            queue.dequeue()
+        for i in range(N):
+            queue.dequeue()
+        elapsed = time.perf_counter() - start
+        print("{name}: {ops:.2f}M operations/s".format(name=cls.__name__, ops=3 * N / elapsed / 1e6))
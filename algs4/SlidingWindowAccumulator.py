@@ -0,0 +1,159 @@
+"""
+The SlidingWindowAccumulator class is a data type for computing the mean, sample standard deviation,
+and sample variance of the most recent data values of a stream: either the last size values, or the
+values added during the last given number of seconds.
+
+The window is divided into buckets, each an Accumulator of the values of one slice of the window,
+kept in a ring. Adding a value updates the newest bucket. When the newest bucket is full, or its
+time slice has passed, the ring is rotated by one position and the oldest bucket is replaced by an
+empty one, so old values expire a bucket at a time without being stored. The statistics are computed
+by merging the buckets. The window is therefore approximate: it holds the values of the last size
+values or seconds, rounded up to a whole bucket.
+
+Adding a data value takes constant amortized time, and computing the statistics takes time
+proportional to the number of buckets. The amount of memory is proportional to the number of
+buckets, independent of the size of the window.
+
+::
+
+    latency = SlidingWindowAccumulator(seconds=60, buckets=12)
+    latency.addDataValue(elapsed)
+    print(latency.mean(), latency.stddev())
+
+% python SlidingWindowAccumulator.py
+"""
+
+import math
+import time
+
+from Accumulator import Accumulator
+
+
+class SlidingWindowAccumulator:
+
+    __slots__ = ("buckets", "current", "bucketSize", "span", "epoch", "clock")
+
+    def __init__(self, size=None, seconds=None, buckets=10, clock=time.monotonic):
+        """Initializes an empty window over the last size values, or over the last given number of seconds.
+
+        :param size: the number of most recent values in the window.
+        :param seconds: the duration of the window, in seconds.
+        :param buckets: the number of buckets the window is divided into.
+        :param clock: function returning the current time in seconds, for a time window.
+        """
+        if (size is None) == (seconds is None):
+            raise ValueError("Exactly one of size or seconds must be given.")
+        if buckets <= 0:
+            raise ValueError("Number of buckets must be positive.")
+        if size is not None and size <= 0 or seconds is not None and seconds <= 0:
+            raise ValueError("Window must be positive.")
+        # one more bucket than the window is divided into, for the newest, partially filled one
+        self.buckets = [Accumulator() for i in range(buckets + 1)]
+        self.current = 0
+        self.bucketSize = None if size is None else -(-size // buckets)
+        self.span = None if seconds is None else seconds / buckets
+        self.clock = clock
+        self.epoch = None if seconds is None else math.floor(clock() / self.span)
+
+    def _advance(self, steps):
+        """Rotates the ring by the given number of buckets, emptying the buckets that expire."""
+        buckets = self.buckets
+        for i in range(min(steps, len(buckets))):
+            self.current = (self.current + 1) % len(buckets)
+            buckets[self.current] = Accumulator()
+
+    def _rotate(self):
+        """Expires the buckets whose time slice has passed."""
+        if self.span is not None:
+            epoch = math.floor(self.clock() / self.span)
+            if epoch > self.epoch:
+                self._advance(epoch - self.epoch)
+                self.epoch = epoch
+
+    def addDataValue(self, x):
+        """Adds a data value.
+
+        :param x: the data value.
+        :return: None
+        """
+        self._rotate()
+        bucket = self.buckets[self.current]
+        bucket.addDataValue(x)
+        if bucket.n == self.bucketSize:
+            self._advance(1)
+
+    def addDataValues(self, values):
+        """Adds a batch of data values.
+
+        :param values: a list, an array, or a NumPy array of real numbers.
+        :return: None
+        """
+        if self.span is not None:
+            self._rotate()
+            self.buckets[self.current].addDataValues(values)
+            return
+        i = 0
+        while i < len(values):
+            bucket = self.buckets[self.current]
+            end = i + self.bucketSize - bucket.n
+            bucket.addDataValues(values[i:end])
+            i = end
+            if bucket.n == self.bucketSize:
+                self._advance(1)
+
+    def snapshot(self):
+        """Returns an Accumulator of the data values in the window.
+
+        :return: a new accumulator.
+        """
+        self._rotate()
+        return Accumulator.combine(self.buckets)
+
+    def mean(self):
+        """Return the mean of the data values in the window.
+
+        :return: the mean value.
+        """
+        return self.snapshot().mean()
+
+    def var(self):
+        """Returns the sample variance of the data values in the window.
+
+        :return: variance
+        """
+        return self.snapshot().var()
+
+    def stddev(self):
+        """Returns the sample standard deviation of the data values in the window.
+
+        :return: standard deviation
+        """
+        return self.snapshot().stddev()
+
+    def count(self):
+        """Returns the number of data values in the window.
+
+        :return: number of data values.
+        """
+        self._rotate()
+        return sum(bucket.n for bucket in self.buckets)
+
+    def __str__(self):
+        """String representation of the window.
+
+        :return: string representation of the window
+        """
+        return str(self.snapshot())
+
+
+if __name__ == '__main__':
+    # Updates per second, and the statistics of a count window over a stream whose mean shifts.
+    import random
+
+    N = 1000000
+    window = SlidingWindowAccumulator(size=10000, buckets=10)
+    start = time.perf_counter()
+    for i in range(N):
+        window.addDataValue(random.gauss(0.0 if i < N // 2 else 10.0, 1.0))
+    elapsed = time.perf_counter() - start
+    print("{:.0f} updates/s, {}".format(N / elapsed, window))
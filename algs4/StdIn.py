@@ -188,27 +188,138 @@ will have an extra character \uFEFF at the beginning.
 """
 
 import re
+import sys
 
-from collections import Iterator
+from typing import Iterator
 
 from In import NoSuchElementException, InputMismatchException
 
 
 class StdIn:
+    """
+    Standard input, read incrementally.
+
+    Input is read in chunks with readinto1() into a reusable buffer, and a cursor tracks the read position,
+    so each read takes constant amortized time and memory stays bounded for unbounded pipes: the buffer
+    only grows beyond buffer_size if a single token or line is longer than that. Tokens are separated by
+    ASCII whitespace and decoded as UTF-8.
+    """
+
+    # assume Unicode UTF-8 encoding
+    CHARSET_NAME = "utf-8"
+
+    # initial size of the read buffer
+    BUFFER_SIZE = 1 << 16
 
     WHITESPACE_PATTERN = re.compile(r"""\s+  # matches white-space characters
                                      """, re.X | re.UNICODE)
 
-    def __init__(self, fobj=None):
+    # matches a token in the read buffer
+    TOKEN_PATTERN = re.compile(rb"\S+")
+
+    def __init__(self, fobj=None, buffer_size=BUFFER_SIZE):
+        """Initializes standard input, or an input stream over the given file object.
+
+        :param fobj: file object to read from, sys.stdin by default. The underlying binary buffer of a
+                     text file is used when available.
+        :param buffer_size: initial size of the read buffer.
+        """
+        self.fopen = fobj if fobj is not None else sys.stdin
+        self._source = getattr(self.fopen, "buffer", self.fopen)
+        # readinto1 returns what is available with at most one read from the raw stream, so a live pipe or a
+        # terminal is read incrementally; BufferedReader.readinto waits until the view is full or at EOF
+        readinto = getattr(self._source, "readinto1", None) or getattr(self._source, "readinto", None)
+        self._readinto = readinto if readinto is not None else self._readinto_text
+        self._buf = bytearray(max(buffer_size, 4))
+        self._pos = 0
+        self._end = 0
+        self._eof = False
+
+    def _readinto_text(self, view):
+        """Reads from a text source that has no binary buffer, encoding the characters into view."""
+        data = self._source.read(len(view) // 4).encode(self.CHARSET_NAME)
+        view[:len(data)] = data
+        return len(data)
+
+    def _fill(self):
+        """Moves the unread bytes to the front of the buffer and reads more input after them.
+
+        :return: True if more input was read, False at the end of the input.
+        """
+        if self._eof:
+            return False
+        if self._pos:
+            unread = self._end - self._pos
+            self._buf[:unread] = self._buf[self._pos:self._end]
+            self._pos, self._end = 0, unread
+        if len(self._buf) - self._end < max(4, len(self._buf) // 4):
+            # a token or line longer than the buffer
+            self._buf.extend(bytes(len(self._buf)))
+        with memoryview(self._buf) as view:
+            n = self._readinto(view[self._end:])
+        if not n:
+            self._eof = True
+            return False
+        self._end += n
+        return True
+
+    def _peek(self):
+        """Finds the next token without consuming it, moving the cursor to its start.
+
+        :return: the match of the next token, or None at the end of the input.
+        """
+        while True:
+            match = self.TOKEN_PATTERN.search(self._buf, self._pos, self._end)
+            if match is None:
+                self._pos = self._end
+                if not self._fill():
+                    return None
+                continue
+            self._pos = match.start()
+            if match.end() == self._end and not self._eof:
+                # the token may continue in the input not read yet
+                self._fill()
+                continue
+            return match
+
+    def _next_token(self, kind):
+        match = self._peek()
+        if match is None:
+            raise NoSuchElementException("attempts to read a '" + kind + "' value from standard input, "
+                                         + "but no more tokens are available")
+        self._pos = match.end()
+        return match.group()
 
-        if fobj:
-            self.fopen = fobj
-            self.lines = self.fopen.readlines()
-            self.content = "".join(self.lines)
-            self.scanned_contents = re.split(self.WHITESPACE_PATTERN, self.content)
+    def _has_next(self, parse):
+        match = self._peek()
+        if match is None:
+            return False
+        try:
+            parse(match.group())
+        except ValueError:
+            return False
+        return True
 
     def isEmpty(self):
-        return len(self.lines) == 0
+        """Returns true if standard input is empty, except possibly for whitespace.
+
+        :return: True if standard input has no more tokens, False otherwise
+        """
+        return self._peek() is None
+
+    def hasNextInt(self):
+        """Returns true if the next token on standard input can be read as an int.
+
+        :return: True if readInt() would succeed, False otherwise
+        """
+        return self._has_next(int)
+
+    def hasNextDouble(self):
+        """Returns true if the next token on standard input can be read as a double.
+
+        :return: True if readDouble() would succeed, False otherwise
+        """
+        return self._has_next(float)
 
     def hasNextLine(self):
         """Returns true if standard input has a next line.
@@ -217,54 +328,74 @@ class StdIn:
 
         :return: if standard input has more input (including whitespace); , False, otherwise
         """
-        return bool(self.lines)
+        return self._pos < self._end or self._fill()
 
     def hasNextChar(self):
-        all_lines = " ".join(self.lines)
-        _chars = all_lines.split(" ")
-        return bool(_chars)
+        """Returns true if standard input has more input (including whitespace).
+
+        :return: True if standard input has more input, False otherwise
+        """
+        return self.hasNextLine()
 
     def readLine(self):
         """Reads and returns the next line, excluding the line separator if present.
 
         :return: @return the next line, excluding the line separator if present; {@code null} if no such line
         """
-        try:
-            for line in self.lines:
-                yield line
-        except StopIteration:
-            return None
+        start = self._pos
+        while True:
+            newline = self._buf.find(b"\n", start, self._end)
+            if newline >= 0:
+                line = self._buf[self._pos:newline]
+                self._pos = newline + 1
+                break
+            start = self._end - self._pos
+            if not self._fill():
+                if self._pos == self._end:
+                    return None
+                line = self._buf[self._pos:self._end]
+                self._pos = self._end
+                break
+            # _fill moved the unread bytes to the front of the buffer
+            start += self._pos
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        return line.decode(self.CHARSET_NAME)
 
     def readChar(self):
         """Reads and returns the next character.
 
         :return: char if available, else None.
         """
-        chars = list(" ".join(self.lines))
-        try:
-            for c in chars:
-                yield c
-        except StopIteration:
+        if not self.hasNextChar():
             return None
+        lead = self._buf[self._pos]
+        length = 1 if lead < 0xc0 else 2 if lead < 0xe0 else 3 if lead < 0xf0 else 4
+        while self._end - self._pos < length and self._fill():
+            pass
+        char = self._buf[self._pos:self._pos + length]
+        self._pos += len(char)
+        return char.decode(self.CHARSET_NAME)
 
     def readAll(self):
         """Reads and returns the remainder of the input, as a string.
 
         :return: the remainder of the input, as a string
         """
-        contents = " ".join(self.lines)
-        return contents
+        chunks = [self._buf[self._pos:self._end]]
+        self._pos = self._end
+        while self._fill():
+            chunks.append(self._buf[self._pos:self._end])
+            self._pos = self._end
+        return b"".join(chunks).decode(self.CHARSET_NAME)
 
     def readString(self):
-        """Reads and returns the next String, excluding the line separator if present.
+        """Reads the next token from standard input and returns it as a String.
 
-        :return: @return the next line, or raise a NoSuchElementException if the next line is not present.
+        @throws NoSuchElementException if standard input is empty
+        :return: the next token
         """
-        try:
-            for line in self.lines:
-                yield line
-        except StopIteration:
-            raise NoSuchElementException
+        return self._next_token("String").decode(self.CHARSET_NAME)
 
     def readInt(self) -> int:
         """Reads the next token from this input stream, parses it as a int, and returns the int.
@@ -273,49 +404,37 @@ class StdIn:
         @throws InputMismatchException if the next token cannot be parsed as an int
         :return: the next int in this input stream
         """
-
-        contents = list(" ".join(self.lines))
-
-        if not contents:
-            raise NoSuchElementException("attemps to read an 'int' value from the input stream, "
-                                         + "but no more tokens are available")
-
-        for token in contents:
-            try:
-                yield int(token)
-            except ValueError:
-                raise InputMismatchException("attempts to read an 'int' value from the input stream, "
-                                             + "but the next token is \"" + token + "\"")
+        token = self._next_token("int")
+        try:
+            return int(token)
+        except ValueError:
+            raise InputMismatchException("attempts to read an 'int' value from the input stream, "
+                                         + "but the next token is \"" + token.decode(self.CHARSET_NAME)
+                                         + "\"") from None
 
     def readDouble(self) -> float:
         """Reads the next token from this input stream, parses it as a Double,
         and returns the Double.
 
         @throws NoSuchElementException if the input stream is empty
-        @throws InputMismatchException if the next token cannot be parsed as an int
-        :return: the next int in this input stream
+        @throws InputMismatchException if the next token cannot be parsed as a float
+        :return: the next float in this input stream
         """
-
-        contents = list(" ".join(self.lines))
-
-        if not contents:
-            raise NoSuchElementException("attemps to read an 'float' value from the input stream, "
-                                         + "but no more tokens are available")
-
-        for token in contents:
-            try:
-                yield float(token)
-            except ValueError:
-                raise InputMismatchException("attempts to read an 'int' value from the input stream, "
-                                             + "but the next token is \"" + token + "\"")
+        token = self._next_token("float")
+        try:
+            return float(token)
+        except ValueError:
+            raise InputMismatchException("attempts to read a 'float' value from the input stream, "
+                                         + "but the next token is \"" + token.decode(self.CHARSET_NAME)
+                                         + "\"") from None
 
     def readFloat(self) -> float:
         """Reads the next token from this input stream, parses it as a Double,
         and returns the Double.
 
         @throws NoSuchElementException if the input stream is empty
-        @throws InputMismatchException if the next token cannot be parsed as an int
-        :return: the next int in this input stream
+        @throws InputMismatchException if the next token cannot be parsed as a float
+        :return: the next float in this input stream
         """
 
         return self.readDouble()
@@ -329,18 +448,7 @@ class StdIn:
         :return: the next int in this input stream
         """
 
-        contents = list(" ".join(self.lines))
-
-        if not contents:
-            raise NoSuchElementException("attemps to read an 'int' value from the input stream, "
-                                         + "but no more tokens are available")
-
-        for token in contents:
-            try:
-                yield int(token)
-            except ValueError:
-                raise InputMismatchException("attempts to read an 'int' value from the input stream, "
-                                             + "but the next token is \"" + token + "\"")
+        return self.readInt()
 
     def readShort(self) -> int:
         """Reads the next token from this input stream, parses it as a int,
@@ -351,34 +459,30 @@ class StdIn:
         :return: the next int in this input stream
         """
 
-        contents = list(" ".join(self.lines))
-
-        if not contents:
-            raise NoSuchElementException("attemps to read an 'int' value from the input stream, "
-                                         + "but no more tokens are available")
-
-        for token in contents:
-            try:
-                yield int(token)
-            except ValueError:
-                raise InputMismatchException("attempts to read an 'int' value from the input stream, "
-                                             + "but the next token is \"" + token + "\"")
+        return self.readInt()
 
     def readAllStrings(self) -> list:
         """Reads all remaining tokens from this input stream and returns them as an array of strings.
 
         :return: all remaining tokens in this input stream, as an array of strings
         """
-        return re.split(self.WHITESPACE_PATTERN, self.content)
+        tokens = []
+        while not self.isEmpty():
+            tokens.append(self.readString())
+        return tokens
 
-    def readAllLines(self) -> str:
+    def readAllLines(self) -> list:
         """
         Reads and returns all the lines of hte input.
 
         :return: List of Lines.
         """
-
-        return self.lines
+        lines = []
+        line = self.readLine()
+        while line is not None:
+            lines.append(line)
+            line = self.readLine()
+        return lines
 
     def readAllInts(self) -> Iterator[int]:
         """Reads all remaining tokens from this input stream, parses them as integers, and returns them as an
@@ -386,8 +490,10 @@ class StdIn:
 
         :return: all remaining lines in this input stream, as an array of integers
         """
-        tokens = self.readAllStrings()
-        return list(map(int, tokens))
+        values = []
+        while not self.isEmpty():
+            values.append(self.readInt())
+        return values
 
     def readAllLongs(self) -> Iterator[int]:
         """Reads all remaining tokens from this input stream, parses them as longs, and returns them as an
@@ -403,8 +509,10 @@ class StdIn:
 
         :return: All remaining lines in this input stream, as an array of doubles
         """
-        tokens = self.readAllStrings()
-        return list(map(float, tokens))
+        values = []
+        while not self.isEmpty():
+            values.append(self.readDouble())
+        return values
 
     def close(self):
         """Close the stream.
@@ -412,3 +520,12 @@ class StdIn:
         :return: None.
         """
         self.fopen.close()
+
+
+if __name__ == '__main__':
+    # % seq 1 1000000 | python StdIn.py
+    stdin = StdIn()
+    total = 0
+    while stdin.hasNextInt():
+        total += stdin.readInt()
+    print(total)
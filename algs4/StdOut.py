@@ -6,6 +6,9 @@ This class provides methods for printing strings and numbers to standard output.
   {@link Double#parseDouble(String)}, and floating-point literals.
 * StdOut <em>flushes</em> standard output after each call to {@code print()} so that text
   will appear immediately in the terminal.
+* For high-volume output, setBuffered() collects output in a buffer that is written with a single
+  call when it fills up, on flush(), and at exit. printlnMany() writes a whole iterable at once,
+  formatting numbers in batches.
 
 For additional documentation,
 see <a href="https://introcs.cs.princeton.edu/15inout">Section 1.5</a> of
@@ -13,7 +16,13 @@ see <a href="https://introcs.cs.princeton.edu/15inout">Section 1.5</a> of
 by Robert Sedgewick and Kevin Wayne.
 """
 
+import atexit
+import functools
+import itertools
 import locale
+import re
+import sys
+import threading
 
 
 class StdOut:
@@ -21,9 +30,112 @@ class StdOut:
     # force Unicode UTF-8 encoding; otherwise it's system dependent
     CHARSET_NAME = "UTF-8"
 
+    # default size in characters of the output buffer in buffered mode
+    BUFFER_SIZE = 1 << 16
+
+    # number of items formatted at a time by printlnMany
+    BATCH_SIZE = 4096
+
+    # a printf conversion specification, as recognized by locale.format_string
+    FORMAT_SPEC_PATTERN = re.compile(r"%"
+                                     r"(?:\((?P<key>.*?)\))?"
+                                     r"(?P<modifiers>[-#0-9 +*.hlL]*?)"
+                                     r"(?P<type>[eEfFgGdiouxXcrs%])")
+
+    # locales whose decimal point is always "."
+    PORTABLE_LOCALES = ("C", "POSIX")
+
+    # pending output in buffered mode; None in the default unbuffered mode
+    _buffer = None
+    # guards _buffer and _buffered; held only to append or to swap the buffer out, never while writing
+    _buffer_lock = threading.Lock()
+    # serializes the writes of swapped-out buffers, so output is written in the order it was produced
+    _write_lock = threading.Lock()
+    _buffered = 0
+    _buffer_size = BUFFER_SIZE
+    _atexit_registered = False
+
     def __init__(self):
         pass
 
+    @classmethod
+    def setBuffered(cls, buffer_size=BUFFER_SIZE):
+        """Switches to buffered mode. Output is collected until about buffer_size characters are pending,
+        and is then written to standard output with a single call. Pending output is also written by
+        flush(), close(), setUnbuffered() and at interpreter exit.
+
+        :param buffer_size: number of characters to collect before writing.
+        :return: None
+        """
+        if buffer_size <= 0:
+            raise ValueError("Buffer size must be positive.")
+        with cls._buffer_lock:
+            if cls._buffer is None:
+                cls._buffer = []
+                cls._buffered = 0
+            cls._buffer_size = buffer_size
+        if not cls._atexit_registered:
+            atexit.register(cls.flush)
+            cls._atexit_registered = True
+
+    @classmethod
+    def setUnbuffered(cls):
+        """Writes any pending output and switches back to the default unbuffered mode.
+
+        :return: None
+        """
+        cls._drain(unbuffer=True)
+
+    @classmethod
+    def isBuffered(cls):
+        """Returns True if StdOut is in buffered mode.
+        """
+        return cls._buffer is not None
+
+    @classmethod
+    def flush(cls):
+        """Writes any pending output and flushes standard output.
+
+        :return: None
+        """
+        cls._drain(unbuffer=False)
+
+    @classmethod
+    def _drain(cls, unbuffer):
+        """Swaps the buffer out for an empty one, writes the pending output it held and flushes standard
+        output.
+
+        :param unbuffer: switch to unbuffered mode instead of starting an empty buffer.
+        """
+        with cls._write_lock:
+            with cls._buffer_lock:
+                pending = cls._buffer
+                cls._buffer = None if unbuffer or pending is None else []
+                cls._buffered = 0
+            if pending:
+                sys.stdout.write("".join(pending))
+            sys.stdout.flush()
+
+    @classmethod
+    def _write(cls, s, flush=False):
+        """Writes s, or appends it to the buffer in buffered mode.
+
+        :param s: the string to write.
+        :param flush: flush standard output after writing, in unbuffered mode.
+        """
+        with cls._buffer_lock:
+            buffer = cls._buffer
+            if buffer is not None:
+                buffer.append(s)
+                cls._buffered += len(s)
+                full = cls._buffered >= cls._buffer_size
+        if buffer is None:
+            sys.stdout.write(s)
+            if flush:
+                sys.stdout.flush()
+        elif full:
+            cls.flush()
+
     @classmethod
     def println(cls, x=None):
         """Classmethod for println
@@ -32,9 +144,31 @@ class StdOut:
         :return: prints the output on the console with newline.
         """
         if x is None:
-            print("")
+            cls._write("\n")
         else:
-            print(x)
+            cls._write(str(x) + "\n")
+
+    @classmethod
+    def printlnMany(cls, items, format=None):
+        """Prints each item of an iterable on its own line.
+
+        Items are formatted BATCH_SIZE at a time and each batch is written with a single call. With a
+        printf-style format holding one conversion, such as "%.5f", a whole batch of numbers is formatted
+        by one % operation, which makes this efficient for typed arrays.
+
+        :param items: iterable of objects to print.
+        :param format: printf-style format applied to each item; str() is used if None.
+        :return: None
+        """
+        items = iter(items)
+        while True:
+            batch = tuple(itertools.islice(items, cls.BATCH_SIZE))
+            if not batch:
+                break
+            if format is None:
+                cls._write("\n".join(map(str, batch)) + "\n")
+            else:
+                cls._write((format + "\n") * len(batch) % batch)
 
     @classmethod
     def print(cls, x=None):
@@ -44,9 +178,9 @@ class StdOut:
         :return: print the output on the console without newline.
         """
         if x is None:
-            print("", end="", flush=True)
+            cls._write("", flush=True)
         else:
-            print(x, end='', flush=True)
+            cls._write(str(x), flush=True)
 
     @classmethod
     def close(cls):
@@ -55,7 +189,83 @@ class StdOut:
             will no longer produce output on standard output.
         :return:
         """
-        print("", flush=True)
+        cls._write("\n")
+        cls.flush()
+
+    @staticmethod
+    def _decimal_point(_locale):
+        """Returns the decimal point of the given locale.
+
+        The process locale is never switched, since setlocale is not thread-safe: the conventions are read
+        with localeconv under the current locale, which the application sets to _locale at startup.
+        """
+        if _locale in StdOut.PORTABLE_LOCALES:
+            return "."
+        return locale.localeconv()["decimal_point"]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _compile(format, _locale):
+        """Compiles a printf format for the given locale.
+
+        :return: a list of (literal, spec, nargs, localize) pieces, where spec is a single conversion
+                 specification consuming nargs arguments, or None after the trailing literal, and localize
+                 tells whether the decimal point of the result must be replaced; and the decimal point
+                 of the locale.
+        """
+        decimal_point = "." if _locale is None else StdOut._decimal_point(_locale)
+        pieces = []
+        pos = 0
+        for match in StdOut.FORMAT_SPEC_PATTERN.finditer(format):
+            spec = match.group()
+            if match.group("type") == "%":
+                nargs = 0
+            elif match.group("key") is not None:
+                nargs = None
+            else:
+                nargs = 1 + match.group("modifiers").count("*")
+            localize = match.group("type") in "eEfFgG" and decimal_point != "."
+            pieces.append((format[pos:match.start()], spec, nargs, localize))
+            pos = match.end()
+        pieces.append((format[pos:], None, 0, False))
+        return pieces, decimal_point
+
+    @classmethod
+    def format(cls, format, s, _locale=None):
+        """Formats s with the printf-style format, using the decimal point of the given locale.
+
+        This gives the same result as locale.format_string under that locale, but compiled formats and
+        locale conventions are cached and the process locale is left untouched, so it is cheap to call in
+        a loop and safe to call from several threads.
+
+        :param format: format for the string.
+        :param s: value, tuple of values, or mapping to format.
+        :param _locale: name of the locale, which must be the current LC_NUMERIC locale unless it is "C" or
+                        "POSIX"; or None for the default formatting of the % operator.
+        :return: the formatted string
+        """
+        pieces, decimal_point = cls._compile(format, _locale)
+        args = s if isinstance(s, tuple) else (s,)
+        out = []
+        i = 0
+        for literal, spec, nargs, localize in pieces:
+            out.append(literal)
+            if spec is None:
+                continue
+            if nargs == 0:
+                out.append("%")
+                continue
+            if nargs is None:
+                value = spec % s
+            else:
+                value = spec % args[i:i + nargs]
+                i += nargs
+            if localize:
+                value = value.replace(".", decimal_point, 1)
+            out.append(value)
+        if i != len(args) and not any(nargs is None for _, _, nargs, _ in pieces):
+            raise TypeError("not all arguments converted during string formatting")
+        return "".join(out)
 
     @classmethod
     def printf(cls, format, s, _locale=None):
@@ -67,12 +277,9 @@ class StdOut:
         :return:
         """
         if _locale is not None:
-            locale.setlocale(locale.LC_ALL, _locale)
-            formatted_s = locale.format_string(format, s)
-            print(formatted_s, flush=True)
-            locale.resetlocale()
+            cls._write(cls.format(format, s, _locale) + "\n", flush=True)
         else:
-            print(format % s, flush=True)
+            cls._write(format % s + "\n", flush=True)
 
 
 if __name__ == '__main__':
@@ -80,3 +287,28 @@ if __name__ == '__main__':
     StdOut.println(17)
     StdOut.println(True)
     StdOut.printf("%.6f\n", 1.0/7.0)
+
+    # Compares printing a million doubles one at a time, buffered, and in batches.
+    import os
+    import time
+    from array import array
+
+    values = array("d", (i / 7.0 for i in range(1000000)))
+    stdout = sys.stdout
+    with open(os.devnull, "w") as devnull:
+        sys.stdout = devnull
+        timings = []
+        for mode in ("unbuffered", "buffered", "printlnMany"):
+            if mode != "unbuffered":
+                StdOut.setBuffered()
+            start = time.perf_counter()
+            if mode == "printlnMany":
+                StdOut.printlnMany(values, "%.5f")
+            else:
+                for value in values:
+                    StdOut.printf("%.5f", value)
+            StdOut.setUnbuffered()
+            timings.append((mode, time.perf_counter() - start))
+        sys.stdout = stdout
+    for mode, elapsed in timings:
+        StdOut.println("{}: {:.3f}s".format(mode, elapsed))
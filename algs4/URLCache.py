@@ -0,0 +1,316 @@
+"""
+The URLCache class is an on-disk cache for the contents of URLs read through In.
+
+Each cached URL is stored as a file holding the raw response body, together with the ETag and
+Last-Modified validators sent by the server. When a URL is requested again the cache sends a
+conditional request, and a 304 Not Modified response is served from disk without transferring the
+body; with revalidate=False the network is skipped entirely. Optionally, the parsed contents are
+cached as well, as typed arrays of integers or doubles, so a repeated load also skips the parse.
+
+The total size of the cached files is bounded by max_bytes. When it is exceeded, the least recently
+used URLs are evicted. The hits, misses, parseHits, parseMisses and evictions counters can be used
+to tune the size. A body opened with fetchFile, open or In stays readable after its URL is evicted or
+downloaded again, so another thread filling the cache cannot pull a file out from under a reader.
+
+::
+
+    cache = URLCache("/var/cache/algs4", max_bytes=1 << 30)
+    inp = In(url="https://algs4.cs.princeton.edu/44sp/tinyEWD.txt", cache=cache)
+    weights = cache.readAllDoublesArray("https://algs4.cs.princeton.edu/44sp/tinyEWD.txt")
+"""
+
+import collections
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import urllib.error
+import urllib.request
+from array import array
+
+from In import In
+
+
+class URLCache:
+
+    INDEX_NAME = "index.json"
+
+    # file suffixes of the cached body and of the cached typed arrays, by typecode
+    BODY_SUFFIX = ".body"
+    ARRAY_SUFFIXES = {"q": ".q", "d": ".d"}
+
+    def __init__(self, directory, max_bytes=1 << 30):
+        """Opens the cache in the given directory, creating it if needed.
+
+        :param directory: directory holding the cached files.
+        :param max_bytes: upper bound on the total size of the cached files.
+        """
+        if max_bytes < 0:
+            raise ValueError("Cache size must be nonnegative.")
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.parseHits = 0
+        self.parseMisses = 0
+        self.evictions = 0
+        self._lock = threading.RLock()
+        # incremented on every download, to tell a body from the one that replaced it
+        self._generation = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        # key -> entry, from least to most recently used
+        self._index = collections.OrderedDict()
+        index_path = os.path.join(self.directory, self.INDEX_NAME)
+        if os.path.exists(index_path):
+            with open(index_path) as f:
+                for key, entry in json.load(f):
+                    if os.path.exists(self._path(key, self.BODY_SUFFIX)):
+                        entry.setdefault("generation", 0)
+                        self._index[key] = entry
+                        self._generation = max(self._generation, entry["generation"])
+
+    def _key(self, url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, key + suffix)
+
+    def _save_index(self):
+        fd, tmp = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(fd, "w") as f:
+            json.dump(list(self._index.items()), f)
+        os.replace(tmp, os.path.join(self.directory, self.INDEX_NAME))
+
+    def _remove_arrays(self, key, entry):
+        for typecode, suffix in self.ARRAY_SUFFIXES.items():
+            if entry["arrays"].pop(typecode, None) is not None:
+                try:
+                    os.remove(self._path(key, suffix))
+                except FileNotFoundError:
+                    pass
+
+    def _evict(self, keep):
+        """Evicts least recently used entries, other than keep, until the cache fits in max_bytes."""
+        total = self.size()
+        for key in list(self._index):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            entry = self._index.pop(key)
+            total -= self._entry_size(entry)
+            self._remove_arrays(key, entry)
+            try:
+                os.remove(self._path(key, self.BODY_SUFFIX))
+            except FileNotFoundError:
+                pass
+            self.evictions += 1
+
+    def _entry_size(self, entry):
+        return entry["size"] + sum(entry["arrays"].values())
+
+    def size(self):
+        """Returns the total size in bytes of the cached files.
+        """
+        with self._lock:
+            return sum(self._entry_size(entry) for entry in self._index.values())
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, url):
+        return self._key(url) in self._index
+
+    def stats(self):
+        """Returns the cache counters.
+
+        :return: dict with the hits, misses, parseHits, parseMisses and evictions counters, the number of
+                 cached URLs and their total size in bytes.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "parseHits": self.parseHits,
+                    "parseMisses": self.parseMisses, "evictions": self.evictions,
+                    "entries": len(self._index), "bytes": self.size()}
+
+    def fetch(self, url, revalidate=True):
+        """Returns the path of a local file holding the body of the given URL, downloading it on a miss.
+        Another thread may evict the file before it is opened; use fetchFile to read it safely.
+
+        :param url: the URL.
+        :param revalidate: if True, a cached body is validated with a conditional request; if False it is
+                           used without contacting the server.
+        :return: path of the cached body.
+        """
+        key = self._key(url)
+        path = self._path(key, self.BODY_SUFFIX)
+        # the lock guards the index only; the request and the download run without it, so one slow
+        # download does not hold up the other threads
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is not None and not revalidate:
+                self._index.move_to_end(key)
+                self.hits += 1
+                return path
+            etag = entry["etag"] if entry is not None else None
+            lastModified = entry["lastModified"] if entry is not None else None
+
+        request = urllib.request.Request(url)
+        if etag:
+            request.add_header("If-None-Match", etag)
+        if lastModified:
+            request.add_header("If-Modified-Since", lastModified)
+
+        try:
+            response = urllib.request.urlopen(request)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and entry is not None:
+                e.close()
+                with self._lock:
+                    entry = self._index.get(key)
+                    if entry is not None:
+                        self._index.move_to_end(key)
+                        self.hits += 1
+                        # the server may send updated validators; otherwise there is nothing to save
+                        etag = e.headers.get("ETag", entry["etag"])
+                        lastModified = e.headers.get("Last-Modified", entry["lastModified"])
+                        if (etag, lastModified) != (entry["etag"], entry["lastModified"]):
+                            entry["etag"], entry["lastModified"] = etag, lastModified
+                            self._save_index()
+                        return path
+                # evicted while revalidating: download it again
+                return self.fetch(url, revalidate)
+            raise
+
+        with response:
+            fd, tmp = tempfile.mkstemp(dir=self.directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    shutil.copyfileobj(response, f)
+            except BaseException:
+                os.remove(tmp)
+                raise
+            etag = response.headers.get("ETag")
+            lastModified = response.headers.get("Last-Modified")
+
+        with self._lock:
+            os.replace(tmp, path)
+            entry = self._index.get(key)
+            if entry is not None:
+                self._remove_arrays(key, entry)
+            self._generation += 1
+            self._index[key] = {"url": url, "etag": etag, "lastModified": lastModified,
+                                "size": os.path.getsize(path), "generation": self._generation, "arrays": {}}
+            self._index.move_to_end(key)
+            self.misses += 1
+            self._evict(keep=key)
+            self._save_index()
+        return path
+
+    def _open_body(self, url, revalidate):
+        """Returns the cached body of the given URL opened for reading, with its generation. The body is
+        opened under the lock, so it cannot be evicted between the fetch and the open."""
+        key = self._key(url)
+        while True:
+            path = self.fetch(url, revalidate)
+            with self._lock:
+                entry = self._index.get(key)
+                if entry is not None:
+                    return open(path, "rb"), entry["generation"]
+            # evicted by another thread right after the fetch: fetch it again
+
+    def fetchFile(self, url, revalidate=True):
+        """Returns the body of the given URL as a binary file opened for reading, downloading it on a miss.
+        Unlike the path returned by fetch, the open file stays readable if the URL is later evicted.
+
+        :param url: the URL.
+        :param revalidate: see fetch.
+        :return: the open body.
+        """
+        return self._open_body(url, revalidate)[0]
+
+    def open(self, url, revalidate=True, **kwargs):
+        """Returns an In reading the cached body of the given URL. Keyword arguments are passed to In.
+
+        :param url: the URL.
+        :param revalidate: see fetch.
+        :return: the input stream.
+        """
+        return In(self.fetchFile(url, revalidate), **kwargs)
+
+    def _read_array(self, url, typecode, revalidate):
+        body, generation = self._open_body(url, revalidate)
+        key = self._key(url)
+        array_path = self._path(key, self.ARRAY_SUFFIXES[typecode])
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is not None and entry["generation"] == generation and typecode in entry["arrays"]:
+                body.close()
+                values = array(typecode)
+                with open(array_path, "rb") as f:
+                    values.frombytes(f.read())
+                self.parseHits += 1
+                return values
+
+        inp = In(body, stream=True)
+        try:
+            values = inp.readAllIntsArray(False) if typecode == "q" else inp.readAllDoublesArray(False)
+        finally:
+            inp.close()
+
+        with self._lock:
+            self.parseMisses += 1
+            entry = self._index.get(key)
+            # the body may have been evicted or replaced while parsing
+            if entry is not None and entry["generation"] == generation:
+                with open(array_path, "wb") as f:
+                    values.tofile(f)
+                entry["arrays"][typecode] = os.path.getsize(array_path)
+                self._evict(keep=key)
+                self._save_index()
+        return values
+
+    def readAllIntsArray(self, url, revalidate=True):
+        """Returns the tokens of the given URL parsed as an array('q'), from the cache when possible.
+
+        :param url: the URL.
+        :param revalidate: see fetch.
+        :return: all tokens of the URL, as an array of integers
+        """
+        return self._read_array(url, "q", revalidate)
+
+    def readAllDoublesArray(self, url, revalidate=True):
+        """Returns the tokens of the given URL parsed as an array('d'), from the cache when possible.
+
+        :param url: the URL.
+        :param revalidate: see fetch.
+        :return: all tokens of the URL, as an array of doubles
+        """
+        return self._read_array(url, "d", revalidate)
+
+    def clear(self):
+        """Removes all cached files.
+
+        :return: None
+        """
+        with self._lock:
+            for key, entry in list(self._index.items()):
+                self._remove_arrays(key, entry)
+                try:
+                    os.remove(self._path(key, self.BODY_SUFFIX))
+                except FileNotFoundError:
+                    pass
+            self._index.clear()
+            self._save_index()
+
+
+if __name__ == '__main__':
+    # % python URLCache.py /tmp/algs4-cache https://algs4.cs.princeton.edu/44sp/tinyEWD.txt
+    import sys
+
+    cache = URLCache(sys.argv[1])
+    for url in sys.argv[2:]:
+        print(url, len(cache.readAllDoublesArray(url)))
+    print(cache.stats())
@@ -0,0 +1,56 @@
+import math
+import pickle
+import random
+import unittest
+from array import array
+
+import sys
+sys.path.append('..')
+
+from algs4.Accumulator import Accumulator
+
+
+class AccumulatorTest(unittest.TestCase):
+
+    def test_single_values(self):
+        stats = Accumulator()
+        self.assertTrue(math.isnan(stats.var()))
+        for x in (2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0):
+            stats.addDataValue(x)
+        self.assertEqual(stats.count(), 8)
+        self.assertAlmostEqual(stats.mean(), 5.0)
+        self.assertAlmostEqual(stats.var(), 32.0 / 7)
+
+    def test_batches_match_single_values(self):
+        values = [random.gauss(1e6, 3.0) for i in range(10000)]
+        one = Accumulator()
+        for x in values:
+            one.addDataValue(x)
+        batched = Accumulator()
+        batched.addDataValue(values[0])
+        batched.addDataValues(values[1:4000])
+        batched.addDataValues(array("d", values[4000:9000]))
+        batched.addDataValues([])
+        batched.addDataValues(x for x in values[9000:])
+        self.assertEqual(batched.count(), one.count())
+        self.assertTrue(math.isclose(batched.mean(), one.mean(), rel_tol=1e-12))
+        self.assertTrue(math.isclose(batched.var(), one.var(), rel_tol=1e-9))
+
+    def test_merge_and_pickle(self):
+        values = [random.uniform(-5.0, 5.0) for i in range(3000)]
+        whole = Accumulator()
+        whole.addDataValues(values)
+        parts = [Accumulator() for i in range(3)]
+        for i, x in enumerate(values):
+            parts[i % 3].addDataValue(x)
+        parts = [pickle.loads(pickle.dumps(part)) for part in parts]
+        combined = Accumulator.combine(parts + [Accumulator()])
+        self.assertEqual(combined.count(), 3000)
+        self.assertTrue(math.isclose(combined.mean(), whole.mean(), rel_tol=1e-9, abs_tol=1e-12))
+        self.assertTrue(math.isclose(combined.var(), whole.var(), rel_tol=1e-12))
+
+        parts[0].merge(parts[1])
+        self.assertEqual(parts[0].count(), 2000)
+        self.assertEqual(parts[1].count(), 1000)
+        self.assertEqual(Accumulator().__getstate__(), (0, 0.0, 0.0))
+        self.assertFalse(hasattr(Accumulator(), "__dict__"))
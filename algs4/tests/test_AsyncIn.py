@@ -0,0 +1,95 @@
+import asyncio
+import http.server
+import os
+import sys
+import threading
+import unittest
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from AsyncIn import AsyncIn
+from In import InputMismatchException, NoSuchElementException
+
+BODY = "".join("{} {} {:.2f}\n".format(i, i * 3 % 17, i / 8) for i in range(3000)).encode()
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/missing":
+            self.send_error(404)
+            return
+        self.send_response(200)
+        if self.path == "/chunked":
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(0, len(BODY), 1000):
+                piece = BODY[i:i + 1000]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class AsyncInTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.base = "http://127.0.0.1:{}".format(cls.server.server_address[1])
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_tokens(self):
+        async def run():
+            inp = await AsyncIn.open(self.base + "/tinyEWD.txt", chunk_size=7)
+            self.assertEqual(await inp.readInt(), 0)
+            self.assertEqual(await inp.readString(), "0")
+            self.assertEqual(await inp.readDouble(), 0.0)
+            self.assertEqual(await inp.readInt(), 1)
+            self.assertEqual(await inp.readInt(), 3)
+            with self.assertRaises(InputMismatchException):
+                await inp.readInt()
+            rest = await inp.readAllStrings()
+            self.assertEqual(len(rest), 3 * 3000 - 6)
+            self.assertTrue(await inp.isEmpty())
+            with self.assertRaises(NoSuchElementException):
+                await inp.readInt()
+            await inp.close()
+
+        asyncio.run(run())
+
+    def test_concurrent_batches(self):
+        expected = array("d", map(float, BODY.split()))
+
+        async def load(path):
+            inp = await AsyncIn.open(self.base + path, chunk_size=512)
+            values = await inp.readAllDoublesArray()
+            await inp.close()
+            return values
+
+        async def run():
+            return await asyncio.gather(*(load(path) for path in ["/a", "/chunked"] * 4))
+
+        for values in asyncio.run(run()):
+            self.assertEqual(values, expected)
+
+    def test_errors(self):
+        async def run():
+            with self.assertRaises(IOError):
+                await AsyncIn.open(self.base + "/missing")
+            with self.assertRaises(ValueError):
+                await AsyncIn.open("ftp://example.com/tinyEWD.txt")
+
+        asyncio.run(run())
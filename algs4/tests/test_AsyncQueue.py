@@ -0,0 +1,75 @@
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from AsyncQueue import AsyncQueue
+from BlockingQueue import QueueClosedException, QueueFullException
+from ResizingArrayQueue import NoSuchElementException
+
+
+class AsyncQueueTest(unittest.TestCase):
+
+    def test_timeouts(self):
+        async def run():
+            queue = AsyncQueue(2)
+            await queue.enqueue(1)
+            await queue.enqueue(2)
+            with self.assertRaises(QueueFullException):
+                await queue.enqueue(3, timeout=0.01)
+            self.assertEqual(queue.size(), 2)
+            self.assertEqual(queue.peek(), 1)
+            self.assertEqual(await queue.dequeue(), 1)
+            self.assertEqual(await queue.drain(), [2])
+            self.assertTrue(queue.isEmpty())
+            with self.assertRaises(NoSuchElementException):
+                await queue.dequeueUpTo(4, timeout=0.01)
+            with self.assertRaises(QueueFullException):
+                await queue.enqueueMany(range(5), timeout=0.01)
+            self.assertEqual(await queue.drain(), [0, 1])
+        asyncio.run(run())
+
+    def test_close(self):
+        async def run():
+            queue = AsyncQueue(4)
+            await queue.enqueueMany([1, 2, 3])
+            await queue.close()
+            with self.assertRaises(QueueClosedException):
+                await queue.enqueue(4)
+            self.assertEqual(await queue.dequeueUpTo(2), [1, 2])
+            self.assertEqual([item async for item in queue], [3])
+            with self.assertRaises(QueueClosedException):
+                await queue.dequeue()
+        asyncio.run(run())
+
+    def test_backpressure(self):
+        async def run():
+            queue = AsyncQueue(8)
+            peak = 0
+
+            async def produce():
+                await queue.enqueueMany(range(50))
+                for i in range(50, 100):
+                    await queue.enqueue(i)
+                await queue.close()
+
+            async def consume():
+                nonlocal peak
+                items = []
+                while True:
+                    peak = max(peak, queue.size())
+                    try:
+                        items.extend(await queue.dequeueUpTo(3))
+                    except QueueClosedException:
+                        return items
+                    await asyncio.sleep(0)
+
+            producer = asyncio.create_task(produce())
+            items = await consume()
+            await producer
+            self.assertEqual(items, list(range(100)))
+            self.assertLessEqual(peak, 8)
+        asyncio.run(run())
+
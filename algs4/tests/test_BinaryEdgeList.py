@@ -0,0 +1,67 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BinaryEdgeList import BinaryEdgeList
+from EdgeWeightedDigraph import EdgeWeightedDigraph
+from EdgeWeightedGraph import EdgeWeightedGraph
+from In import In
+
+TINY_EWD = """8
+6
+4 5 0.35
+5 4 0.35
+4 7 0.37
+5 7 0.28
+7 7 0.50
+0 2 0.26
+"""
+
+
+def edge_tuples(G):
+    return sorted((e.from_vertex(), e.to_vertex(), e.weight) for e in G.edges())
+
+
+class BinaryEdgeListTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "tinyEWD.bin")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_digraph_round_trip(self):
+        G = EdgeWeightedDigraph(In=In(io.StringIO(TINY_EWD)))
+        self.assertEqual((G.V, G.E), (8, 6))
+        G.writeBinary(self.path)
+
+        V, E, tails, heads, weights, directed = BinaryEdgeList.read(self.path)
+        self.assertEqual((V, E, directed), (8, 6, True))
+        self.assertEqual(list(tails), [0, 4, 4, 5, 5, 7])
+
+        H = EdgeWeightedDigraph.readBinary(self.path)
+        self.assertEqual((H.V, H.E), (8, 6))
+        self.assertEqual(edge_tuples(H), edge_tuples(G))
+        self.assertEqual(H.inDegree(7), 3)
+        self.assertRaises(ValueError, EdgeWeightedGraph.readBinary, self.path)
+
+    def test_graph_round_trip(self):
+        G = EdgeWeightedGraph(In=In(io.StringIO(TINY_EWD)))
+        self.assertEqual(len(G.edges()), 6)
+        G.writeBinary(self.path)
+
+        H = EdgeWeightedGraph.readBinary(self.path)
+        self.assertEqual((H.V, H.E), (8, 6))
+        self.assertEqual(edge_tuples(H), edge_tuples(G))
+        self.assertEqual(BinaryEdgeList.read(self.path)[5], False)
+        self.assertRaises(ValueError, EdgeWeightedDigraph.readBinary, self.path)
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"8\n6\n4 5 0.35\n5 4 0.35\n")
+        self.assertRaises(ValueError, BinaryEdgeList.read, self.path)
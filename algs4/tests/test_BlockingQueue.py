@@ -0,0 +1,62 @@
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from BlockingQueue import BlockingQueue, QueueClosedException, QueueFullException
+from ResizingArrayQueue import NoSuchElementException
+
+
+class BlockingQueueTest(unittest.TestCase):
+
+    def test_non_blocking(self):
+        queue = BlockingQueue(2)
+        queue.enqueue(1)
+        queue.enqueue(2, block=False)
+        self.assertRaises(QueueFullException, queue.enqueue, 3, block=False)
+        self.assertRaises(QueueFullException, queue.enqueue, 3, timeout=0.01)
+        self.assertEqual(queue.dequeue(), 1)
+        self.assertEqual(queue.drain(), [2])
+        self.assertRaises(NoSuchElementException, queue.dequeue, block=False)
+        self.assertRaises(NoSuchElementException, queue.dequeueMany, 3, timeout=0.01)
+
+    def test_close(self):
+        queue = BlockingQueue(4)
+        queue.enqueueMany([1, 2, 3])
+        queue.close()
+        self.assertRaises(QueueClosedException, queue.enqueue, 4)
+        self.assertEqual(queue.dequeueMany(2), [1, 2])
+        self.assertEqual(queue.dequeue(), 3)
+        self.assertRaises(QueueClosedException, queue.dequeue)
+        self.assertRaises(QueueClosedException, queue.dequeueMany, 2)
+
+    def test_producers_and_consumers(self):
+        queue = BlockingQueue(16)
+        results = []
+        lock = threading.Lock()
+
+        def produce(start):
+            for i in range(start, start + 1000, 50):
+                queue.enqueueMany(range(i, i + 50))
+
+        def consume():
+            while True:
+                try:
+                    batch = queue.dequeueMany(7)
+                except QueueClosedException:
+                    return
+                with lock:
+                    results.extend(batch)
+
+        producers = [threading.Thread(target=produce, args=(i * 1000,)) for i in range(4)]
+        consumers = [threading.Thread(target=consume) for i in range(3)]
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        queue.close()
+        for thread in consumers:
+            thread.join()
+        self.assertEqual(sorted(results), list(range(4000)))
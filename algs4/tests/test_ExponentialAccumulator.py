@@ -0,0 +1,37 @@
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from ExponentialAccumulator import ExponentialAccumulator
+
+
+class ExponentialAccumulatorTest(unittest.TestCase):
+
+    def test_smoothing_factor(self):
+        ewma = ExponentialAccumulator(alpha=0.5)
+        self.assertTrue(math.isnan(ewma.var()))
+        ewma.addDataValue(4.0)
+        self.assertEqual(ewma.mean(), 4.0)
+        ewma.addDataValue(1.0)
+        # weights 0.5 and 1
+        self.assertAlmostEqual(ewma.mean(), 2.0)
+        self.assertAlmostEqual(ewma.var(), (0.5 * (4.0 - 2.0) ** 2 + 1.0 * (1.0 - 2.0) ** 2) / 1.5)
+        for i in range(100):
+            ewma.addDataValue(7.0)
+        self.assertAlmostEqual(ewma.mean(), 7.0)
+        self.assertEqual(ewma.count(), 102)
+
+    def test_half_life(self):
+        now = [0.0]
+        ewma = ExponentialAccumulator(halfLife=10.0, clock=lambda: now[0])
+        ewma.addDataValue(0.0)
+        now[0] = 10.0
+        ewma.addDataValue(3.0)
+        ewma.addDataValue(3.0)
+        # weights 0.5, 1 and 1
+        self.assertAlmostEqual(ewma.mean(), 6.0 / 2.5)
+        self.assertRaises(ValueError, ExponentialAccumulator)
+        self.assertRaises(ValueError, ExponentialAccumulator, alpha=1.5)
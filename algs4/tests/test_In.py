@@ -1,9 +1,18 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import socket
+import tempfile
+import threading
 import unittest
+from array import array
 
 import sys
 sys.path.append('..')
 
-from algs4.In import In
+from algs4.In import In, LineIndex, InputMismatchException, NoSuchElementException
 
 
 class InTest(unittest.TestCase):
@@ -14,3 +23,217 @@ class InTest(unittest.TestCase):
     def test_language(self):
         self.assertEqual(In.LOCALE, 0)
 
+    def test_eager_tokens(self):
+        inp = In(io.StringIO("8 16\n  4 5 0.35\n"))
+        self.assertEqual(inp.readInt(), 8)
+        self.assertEqual(inp.readLong(), 16)
+        self.assertEqual(inp.readString(), "4")
+        self.assertEqual(inp.readAllDoubles(), [5.0, 0.35])
+        self.assertTrue(inp.isEmpty())
+        self.assertRaises(NoSuchElementException, inp.readInt)
+
+    def test_stream_tokens_across_chunks(self):
+        text = "12345 678\n90 abc\t\tdefgh 1.5"
+        for chunk_size in (1, 2, 3, 7, 64):
+            for fobj in (io.StringIO(text), io.BytesIO(text.encode())):
+                inp = In(fobj, stream=True, chunk_size=chunk_size)
+                self.assertEqual(inp.readInt(), 12345)
+                self.assertEqual(inp.readInt(), 678)
+                self.assertEqual(inp.readDouble(), 90.0)
+                self.assertRaises(InputMismatchException, inp.readInt)
+                self.assertEqual(inp.readAllStrings(), ["defgh", "1.5"])
+                self.assertTrue(inp.isEmpty())
+
+    def test_stream_matches_eager(self):
+        text = "".join("{} {} {:.5f}\n".format(i, i * 7 % 13, i / 3) for i in range(500))
+        eager = In(io.StringIO(text)).readAllStrings()
+        streamed = In(io.BytesIO(text.encode()), stream=True, chunk_size=10).readAllStrings()
+        self.assertEqual(eager, streamed)
+
+    def test_read_all_text(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tiny.txt")
+            with open(path, "w") as f:
+                f.write("8 16\n  4 5 0.35\n")
+            inp = In(path)
+            self.assertEqual(inp.readInt(), 8)
+            self.assertEqual(inp.readAll(), " 16\n  4 5 0.35\n")
+            self.assertTrue(inp.isEmpty())
+            inp.close()
+
+            for stream, mapped in ((True, False), (False, True)):
+                inp = In(path, stream=stream, mapped=mapped)
+                for read in (inp.readline, inp.readAllLines, inp.readChar, inp.readAll):
+                    self.assertRaises(io.UnsupportedOperation, read)
+                inp.close()
+
+    def test_mapped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tinyEWD.txt")
+            with open(path, "w") as f:
+                f.write("8\n15\n4 5 0.35\n5 4 0.35\n")
+            inp = In(path, mapped=True)
+            self.assertEqual(inp.readInt(), 8)
+            self.assertEqual(inp.readInt(), 15)
+            self.assertEqual(inp.readString(), "4")
+            self.assertEqual(inp.readAllDoubles(), [5.0, 0.35, 5.0, 4.0, 0.35])
+            self.assertEqual(inp.buffer[:1], b"8")
+            inp.close()
+
+            open(path, "w").close()
+            inp = In(path, mapped=True)
+            self.assertTrue(inp.isEmpty())
+            inp.close()
+
+    def test_typed_arrays(self):
+        inp = In(io.BytesIO(b"3 -7\n 9000000000 1"), stream=True)
+        self.assertEqual(inp.readInt(), 3)
+        ints = inp.readAllIntsArray(use_numpy=False)
+        self.assertEqual(ints, array("q", [-7, 9000000000, 1]))
+
+        inp = In(io.StringIO("0.5 2 -1e3\n"))
+        doubles = inp.readAllDoublesArray(use_numpy=False)
+        self.assertEqual(doubles, array("d", [0.5, 2.0, -1000.0]))
+        self.assertTrue(inp.isEmpty())
+
+    def test_typed_arrays_from_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "numbers.txt")
+            with open(path, "w") as f:
+                f.write("".join("{} {}\n".format(i, -i * 31) for i in range(200)))
+            expected = array("q", [value for i in range(200) for value in (i, -i * 31)])
+            for chunk_size in (1, 5, 64):
+                for mapped in (False, True):
+                    inp = In(path, stream=not mapped, mapped=mapped, chunk_size=chunk_size)
+                    self.assertEqual(inp.readInt(), 0)
+                    self.assertEqual(inp.readInt(), 0)
+                    self.assertFalse(inp.isEmpty())
+                    self.assertEqual(inp.readAllIntsArray(use_numpy=False), expected[2:])
+                    self.assertTrue(inp.isEmpty())
+                    inp.close()
+
+    def test_parallel_matches_serial(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "numbers.txt")
+            with open(path, "w") as f:
+                f.write("".join("{} {}\n".format(i, -i * 31) for i in range(2000)))
+            inp = In(path)
+            try:
+                serial = inp.readAllIntsArray(use_numpy=False)
+            finally:
+                inp.close()
+            for processes in (1, 3):
+                inp = In(path)
+                self.assertEqual(inp.readAllIntsParallel(processes), serial)
+                self.assertTrue(inp.isEmpty())
+                inp.close()
+            self.assertRaises(ValueError, In(io.StringIO("1 2")).readAllIntsParallel)
+
+    def test_compressed(self):
+        text = b"8 15\n4 5 0.35\n"
+        for name, opener in (("gz", gzip.open), ("bz2", bz2.open), ("xz", lzma.open)):
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "tinyEWD." + name)
+                with opener(path, "wb") as f:
+                    f.write(text)
+                for kwargs in ({}, {"stream": True, "chunk_size": 4}, {"mapped": True}):
+                    inp = In(path, **kwargs)
+                    self.assertEqual(inp.readAllStrings(), ["8", "15", "4", "5", "0.35"])
+                    inp.close()
+                inp = In(path)
+                try:
+                    self.assertRaises(io.UnsupportedOperation, inp.readAllLines)
+                    self.assertRaises(ValueError, inp.readAllIntsParallel)
+                finally:
+                    inp.close()
+                inp = In(path, stream=True)
+                try:
+                    self.assertRaises(ValueError, inp.readLineAt, 0)
+                    self.assertRaises(ValueError, inp.readRange, 0, 4)
+                finally:
+                    inp.close()
+
+    def test_read_edges(self):
+        text = "8\n3\n4 5 0.35\n5 4 0.5\n7 0 1e-3\nleft over"
+        for inp in (In(io.StringIO(text)), In(io.BytesIO(text.encode()), stream=True, chunk_size=5)):
+            V, E, tails, heads, weights = inp.readEdges()
+            self.assertEqual((V, E), (8, 3))
+            self.assertEqual(tails, array("i", [4, 5, 7]))
+            self.assertEqual(heads, array("i", [5, 4, 0]))
+            self.assertEqual(weights, array("d", [0.35, 0.5, 0.001]))
+            self.assertEqual(inp.readAllStrings(), ["left", "over"])
+
+        self.assertRaises(NoSuchElementException, In(io.StringIO("8 2 4 5 0.35 5 4")).readEdges)
+        self.assertRaises(InputMismatchException, In(io.StringIO("8 1 4 x 0.35")).readEdges)
+        self.assertRaises(InputMismatchException, In(io.StringIO("3 1 0 99999999999 0.5")).readEdges)
+
+    def test_line_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lines.txt")
+            with open(path, "wb") as f:
+                f.write(b"8\r\n15\n\n4 5 0.35\nlast")
+            inp = In(path, stream=True)
+            self.assertEqual(inp.readInt(), 8)
+            self.assertEqual(len(inp.lineIndex()), 5)
+            self.assertEqual(inp.readLineAt(3), "4 5 0.35")
+            self.assertEqual(inp.readLineAt(0), "8")
+            self.assertEqual(inp.readLineAt(2), "")
+            self.assertEqual(inp.readLineAt(4), "last")
+            self.assertEqual(inp.lineIndex().offsets(1), (3, 6))
+            self.assertEqual(inp.readRange(3, 5), b"15")
+            self.assertRaises(IndexError, inp.readLineAt, 5)
+            self.assertEqual(inp.readInt(), 15)
+            inp.close()
+            self.assertTrue(os.path.exists(path + LineIndex.SUFFIX))
+
+            with open(path, "ab") as f:
+                f.write(b"\nmore\n")
+            index = LineIndex(path)
+            self.assertEqual(len(index), 6)
+            self.assertEqual(index.readLine(5), b"more")
+            index.close()
+
+            open(path, "w").close()
+            index = LineIndex(path)
+            self.assertEqual(len(index), 0)
+            index.close()
+
+    def test_read_range_without_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lines.txt")
+            with open(path, "wb") as f:
+                f.write(b"8\n15\n4 5 0.35\n")
+            inp = In(path, stream=True)
+            self.assertEqual(inp.readInt(), 8)
+            self.assertEqual(inp.readRange(2, 4), b"15")
+            self.assertEqual(inp.readRange(5, 100), b"4 5 0.35\n")
+            self.assertEqual(inp.readInt(), 15)
+            self.assertFalse(os.path.exists(path + LineIndex.SUFFIX))
+
+            index_path = os.path.join(tmp, "elsewhere.idx")
+            self.assertEqual(inp.lineIndex(index_path=index_path).offsets(2), (5, 14))
+            self.assertEqual(inp.readLineAt(1), "15")
+            inp.close()
+            self.assertTrue(os.path.exists(index_path))
+            self.assertFalse(os.path.exists(path + LineIndex.SUFFIX))
+
+    def test_socket(self):
+        server = socket.create_server(("127.0.0.1", 0))
+        edges = "".join("{} {} {:.2f}\n".format(i, i + 1, i / 4) for i in range(5000)).encode()
+
+        def produce():
+            conn, _ = server.accept()
+            with conn:
+                conn.sendall(b"5001\n5000\n")
+                for i in range(0, len(edges), 999):
+                    conn.sendall(edges[i:i + 999])
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        inp = In(sock=server.getsockname(), chunk_size=64)
+        V, E, tails, heads, weights = inp.readEdges()
+        self.assertEqual((V, E, tails[-1], heads[-1], weights[-1]), (5001, 5000, 4999, 5000, 1249.75))
+        self.assertTrue(inp.isEmpty())
+        inp.close()
+        producer.join()
+        server.close()
@@ -0,0 +1,65 @@
+import os
+import sys
+import unittest
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from DirectedEdge import DirectedEdge
+from EdgeWeightedDigraph import EdgeWeightedDigraph
+from EdgeWeightedGraph import EdgeWeightedGraph
+from IntBag import IntBag
+
+
+class IntBagTest(unittest.TestCase):
+
+    def test_add_and_extend(self):
+        bag = IntBag()
+        self.assertTrue(bag.isEmpty())
+        bag.add(3)
+        bag.extend([4, 5])
+        bag.extend(array("i", [6, 7]))
+        bag.extend(array("q", [8]))
+        bag.extend(memoryview(array("i", [9, 10, 11]))[::2])
+        self.assertEqual(list(bag), [3, 4, 5, 6, 7, 8, 9, 11])
+        self.assertEqual(bag.size(), 8)
+        self.assertEqual(str(bag), "3 4 5 6 7 8 9 11")
+        self.assertRaises(OverflowError, bag.add, 1 << 40)
+
+        wide = IntBag("q")
+        wide.add(1 << 40)
+        self.assertEqual(list(wide), [1 << 40])
+        self.assertRaises(ValueError, IntBag, "d")
+
+    def test_view(self):
+        bag = IntBag()
+        bag.extend(range(5))
+        view = bag.view()
+        self.assertEqual(view.format, "i")
+        self.assertEqual(view.tolist(), [0, 1, 2, 3, 4])
+        self.assertTrue(view.readonly)
+        self.assertRaises(BufferError, bag.add, 5)
+        view.release()
+        bag.add(5)
+        self.assertEqual(len(bag), 6)
+
+    def test_graph_neighbor_bags(self):
+        G = EdgeWeightedDigraph(3)
+        G.addEdges([0, 0, 2], [1, 2, 2], [0.5, 0.25, 1.0])
+        self.assertEqual([list(bag) for bag in G.neighborBags()], [[1, 2], [], [2]])
+
+        G = EdgeWeightedGraph(V=3)
+        G.addEdge(DirectedEdge(0, 1, 0.5))
+        G.addEdge(DirectedEdge(2, 2, 1.0))
+        bags = G.neighborBags("q")
+        self.assertEqual([sorted(bag) for bag in bags], [[1], [0], [2, 2]])
+
+    def test_neighbor_bags_from_edges(self):
+        tails, heads = array("i", [0, 0, 2]), array("i", [1, 2, 2])
+        bags = EdgeWeightedDigraph.neighborBagsFromEdges(3, tails, heads)
+        self.assertEqual([list(bag) for bag in bags], [[1, 2], [], [2]])
+        bags = EdgeWeightedGraph.neighborBagsFromEdges(3, tails, heads, "q")
+        self.assertEqual([sorted(bag) for bag in bags], [[1, 2], [0], [0, 2, 2]])
+        self.assertEqual(bags[0].view().format, "q")
+        self.assertRaises(ValueError, EdgeWeightedDigraph.neighborBagsFromEdges, 2, tails, heads)
+
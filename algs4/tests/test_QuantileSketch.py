@@ -0,0 +1,50 @@
+import math
+import pickle
+import random
+import unittest
+from array import array
+
+import sys
+sys.path.append('..')
+
+from algs4.QuantileSketch import QuantileSketch
+
+
+class QuantileSketchTest(unittest.TestCase):
+
+    def test_small_and_empty(self):
+        sketch = QuantileSketch()
+        self.assertTrue(math.isnan(sketch.quantile(0.5)))
+        for x in (3.0, 1.0, 2.0):
+            sketch.addDataValue(x)
+        self.assertEqual(sketch.count(), 3)
+        self.assertEqual(sketch.quantile(0.0), 1.0)
+        self.assertEqual(sketch.quantile(0.5), 2.0)
+        self.assertEqual(sketch.quantile(1.0), 3.0)
+        self.assertRaises(ValueError, sketch.quantile, 1.5)
+
+    def test_rank_error(self):
+        values = list(range(100000))
+        random.shuffle(values)
+        sketch = QuantileSketch(100)
+        sketch.addDataValues(values[:50000])
+        for x in values[50000:]:
+            sketch.addDataValue(x)
+        self.assertEqual(sketch.count(), 100000)
+        self.assertTrue(50 <= sketch.size() <= 100)
+        for q in (0.01, 0.5, 0.99, 0.999):
+            self.assertAlmostEqual(sketch.quantile(q) / 100000, q, delta=0.005)
+
+    def test_merge_and_pickle(self):
+        values = [random.expovariate(1.0) for i in range(20000)]
+        parts = [QuantileSketch(200) for i in range(4)]
+        for i, part in enumerate(parts):
+            part.addDataValues(array("d", values[i::4]))
+        parts = [pickle.loads(pickle.dumps(part)) for part in parts]
+        combined = QuantileSketch.combine(parts + [QuantileSketch()], compression=200)
+        self.assertEqual(combined.count(), 20000)
+        self.assertTrue(100 <= combined.size() <= 200)
+        exact = sorted(values)
+        for q in (0.5, 0.9, 0.99):
+            self.assertAlmostEqual(combined.quantile(q), exact[int(q * 20000)], delta=0.05 * exact[int(q * 20000)])
+        self.assertEqual(combined.quantile(1.0), exact[-1])
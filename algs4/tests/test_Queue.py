@@ -0,0 +1,28 @@
+import unittest
+
+import sys
+sys.path.append('..')
+
+from algs4.Queue import NoSuchElementException, Queue
+
+
+class QueueTest(unittest.TestCase):
+
+    def test_batches(self):
+        queue = Queue()
+        queue.enqueue("to")
+        queue.enqueueMany(["be", "or"])
+        queue.enqueueMany([])
+        queue.enqueueMany(iter(["not", "to", "be"]))
+        self.assertEqual(queue.size(), 6)
+        self.assertEqual(queue.dequeueMany(2), ["to", "be"])
+        self.assertEqual(queue.dequeue(), "or")
+        self.assertEqual(queue.peek(), "not")
+        self.assertEqual(queue.drain(), ["not", "to", "be"])
+        self.assertTrue(queue.isEmpty())
+        self.assertEqual(queue.dequeueMany(3), [])
+        self.assertRaises(NoSuchElementException, queue.dequeue)
+
+        queue.enqueueMany(range(3))
+        queue.enqueue(3)
+        self.assertEqual(queue.dequeueMany(10), [0, 1, 2, 3])
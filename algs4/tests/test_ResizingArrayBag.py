@@ -0,0 +1,30 @@
+import unittest
+
+import sys
+sys.path.append('..')
+
+from algs4.ResizingArrayBag import ResizingArrayBag
+
+
+class ResizingArrayBagTest(unittest.TestCase):
+
+    def test_add_and_extend(self):
+        bag = ResizingArrayBag()
+        self.assertTrue(bag.isEmpty())
+        self.assertEqual(bag.size(), 0)
+        self.assertEqual(list(bag), [])
+        bag.add("a")
+        bag.extend(["b", "c"])
+        bag.extend(x for x in ("d",))
+        bag.extend([])
+        self.assertFalse(bag.isEmpty())
+        self.assertEqual(bag.size(), 4)
+        self.assertEqual(len(bag), 4)
+        self.assertEqual(sorted(bag), ["a", "b", "c", "d"])
+        self.assertEqual(str(bag), "a b c d")
+
+    def test_slots(self):
+        bag = ResizingArrayBag()
+        self.assertFalse(hasattr(bag, "__dict__"))
+        with self.assertRaises(AttributeError):
+            bag.other = 1
@@ -0,0 +1,63 @@
+import unittest
+
+import sys
+sys.path.append('..')
+
+from algs4.ResizingArrayQueue import (ConcurrentModificationException, NoSuchElementException,
+                                      ResizingArrayQueue)
+
+
+class ResizingArrayQueueTest(unittest.TestCase):
+
+    def test_fifo_with_wraparound_and_resizing(self):
+        queue = ResizingArrayQueue()
+        expected = []
+        for i in range(1000):
+            queue.enqueue(i)
+            expected.append(i)
+            if i % 3 == 0:
+                self.assertEqual(queue.dequeue(), expected.pop(0))
+        self.assertEqual(list(queue), expected)
+        self.assertEqual(queue.size(), len(expected))
+        while expected:
+            self.assertEqual(queue.peek(), expected[0])
+            self.assertEqual(queue.dequeue(), expected.pop(0))
+        self.assertTrue(queue.isEmpty())
+        self.assertEqual(len(queue.q), ResizingArrayQueue.INIT_CAPACITY)
+        self.assertRaises(NoSuchElementException, queue.dequeue)
+        self.assertRaises(NoSuchElementException, queue.peek)
+
+    def test_iteration_is_not_destructive(self):
+        queue = ResizingArrayQueue()
+        for item in "to be or not".split():
+            queue.enqueue(item)
+        self.assertEqual(str(queue), "to be or not")
+        self.assertEqual(list(queue), ["to", "be", "or", "not"])
+        self.assertEqual(queue.size(), 4)
+
+    def test_fail_fast_iteration(self):
+        queue = ResizingArrayQueue()
+        queue.enqueue(1)
+        queue.enqueue(2)
+        with self.assertRaises(ConcurrentModificationException):
+            for item in queue:
+                queue.enqueue(item)
+
+    def test_batches(self):
+        queue = ResizingArrayQueue()
+        expected = []
+        next_item = 0
+        for k in (3, 20, 5, 100, 1, 0, 64):
+            batch = list(range(next_item, next_item + k))
+            next_item += k
+            queue.enqueueMany(iter(batch))
+            expected.extend(batch)
+            removed = queue.dequeueMany(k // 2 + 1)
+            self.assertEqual(removed, expected[:len(removed)])
+            del expected[:len(removed)]
+            self.assertEqual(list(queue), expected)
+            self.assertEqual(queue.size(), len(expected))
+        self.assertEqual(queue.drain(), expected)
+        self.assertTrue(queue.isEmpty())
+        self.assertEqual(queue.dequeueMany(5), [])
+        self.assertEqual(len(queue.q), ResizingArrayQueue.INIT_CAPACITY)
@@ -0,0 +1,60 @@
+import multiprocessing
+import os
+import struct
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from SharedMemoryQueue import NoSuchElementException, QueueFullException, SharedMemoryQueue
+
+
+def produce_edges(queue, count):
+    for i in range(count):
+        queue.enqueue((i, i + 1, i / 4))
+    queue.close()
+
+
+class SharedMemoryQueueTest(unittest.TestCase):
+
+    def test_single_process(self):
+        queue = SharedMemoryQueue(3)
+        try:
+            self.assertTrue(queue.isEmpty())
+            for v in (7, 8, 9):
+                queue.enqueue(v)
+            self.assertRaises(QueueFullException, queue.enqueue, 10, block=False)
+            self.assertRaises(QueueFullException, queue.enqueue, 10, timeout=0.01)
+            self.assertEqual(queue.size(), 3)
+            self.assertEqual(queue.peek(), 7)
+            self.assertEqual(queue.dequeue(), 7)
+            queue.enqueue(10)
+            self.assertEqual([queue.dequeue() for i in range(3)], [8, 9, 10])
+            self.assertRaises(NoSuchElementException, queue.dequeue, block=False)
+            self.assertRaises(NoSuchElementException, queue.dequeue, timeout=0.01)
+        finally:
+            queue.unlink()
+
+    def test_rejected_item_keeps_capacity(self):
+        queue = SharedMemoryQueue(2)
+        try:
+            for item in ("x", 1 << 40, (1, 2)):
+                self.assertRaises(struct.error, queue.enqueue, item, block=False)
+            queue.enqueue(1, block=False)
+            queue.enqueue(2, block=False)
+            self.assertEqual(queue.size(), 2)
+            self.assertEqual([queue.dequeue(), queue.dequeue()], [1, 2])
+        finally:
+            queue.unlink()
+
+    def test_across_processes(self):
+        queue = SharedMemoryQueue(16, "iid")
+        try:
+            worker = multiprocessing.Process(target=produce_edges, args=(queue, 500))
+            worker.start()
+            edges = [queue.dequeue(timeout=30) for i in range(500)]
+            worker.join()
+            self.assertEqual(edges, [(i, i + 1, i / 4) for i in range(500)])
+            self.assertTrue(queue.isEmpty())
+        finally:
+            queue.unlink()
@@ -0,0 +1,52 @@
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from SlidingWindowAccumulator import SlidingWindowAccumulator
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SlidingWindowAccumulatorTest(unittest.TestCase):
+
+    def test_count_window(self):
+        window = SlidingWindowAccumulator(size=10, buckets=5)
+        for x in range(100):
+            window.addDataValue(x)
+        self.assertEqual(window.count(), 10)
+        self.assertAlmostEqual(window.mean(), 94.5)
+        window.addDataValue(100)
+        self.assertEqual(window.count(), 11)
+        self.assertAlmostEqual(window.mean(), 95.0)
+
+        batched = SlidingWindowAccumulator(size=10, buckets=5)
+        batched.addDataValues([float(x) for x in range(101)])
+        self.assertEqual(batched.count(), 11)
+        self.assertAlmostEqual(batched.mean(), window.mean())
+        self.assertAlmostEqual(batched.var(), window.var())
+
+    def test_time_window(self):
+        clock = Clock()
+        window = SlidingWindowAccumulator(seconds=60, buckets=6, clock=clock)
+        self.assertTrue(math.isnan(window.var()))
+        for t in range(0, 120, 5):
+            clock.now = t
+            window.addDataValue(1.0 if t < 60 else 3.0)
+        self.assertEqual(window.count(), 14)
+        self.assertAlmostEqual(window.mean(), 3.0 - 4.0 / 14)
+        clock.now = 175
+        self.assertEqual(window.count(), 2)
+        self.assertEqual(window.mean(), 3.0)
+        clock.now = 1000
+        self.assertEqual(window.count(), 0)
+        self.assertRaises(ValueError, SlidingWindowAccumulator, size=10, seconds=60)
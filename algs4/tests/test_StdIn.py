@@ -0,0 +1,64 @@
+import io
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from In import InputMismatchException, NoSuchElementException
+from StdIn import StdIn
+
+
+class StdInTest(unittest.TestCase):
+
+    def test_tokens(self):
+        data = b"  12345 678\n90 abc\t\tdefgh 1.5\n"
+        for buffer_size in (4, 5, 8, 1024):
+            stdin = StdIn(io.BytesIO(data), buffer_size=buffer_size)
+            self.assertTrue(stdin.hasNextInt())
+            self.assertEqual(stdin.readInt(), 12345)
+            self.assertEqual(stdin.readLong(), 678)
+            self.assertEqual(stdin.readDouble(), 90.0)
+            self.assertFalse(stdin.hasNextInt())
+            self.assertRaises(InputMismatchException, stdin.readInt)
+            self.assertEqual(stdin.readString(), "defgh")
+            self.assertTrue(stdin.hasNextDouble())
+            self.assertEqual(stdin.readAllDoubles(), [1.5])
+            self.assertTrue(stdin.isEmpty())
+            self.assertRaises(NoSuchElementException, stdin.readInt)
+
+    def test_lines_and_chars(self):
+        data = "first line\r\nsecond, été\n\nlast".encode("utf-8")
+        for buffer_size in (4, 7, 1024):
+            stdin = StdIn(io.BytesIO(data), buffer_size=buffer_size)
+            self.assertEqual(stdin.readChar(), "f")
+            self.assertEqual(stdin.readLine(), "irst line")
+            self.assertEqual(stdin.readString(), "second,")
+            self.assertEqual(stdin.readChar(), " ")
+            self.assertEqual(stdin.readChar(), "é")
+            self.assertEqual(stdin.readAllLines(), ["té", "", "last"])
+            self.assertFalse(stdin.hasNextLine())
+            self.assertIsNone(stdin.readLine())
+
+    def test_text_source(self):
+        stdin = StdIn(io.StringIO("3 4\nfive"), buffer_size=4)
+        self.assertEqual(stdin.readInt(), 3)
+        self.assertEqual(stdin.readAll(), " 4\nfive")
+        self.assertTrue(stdin.isEmpty())
+
+    def test_open_pipe(self):
+        r, w = os.pipe()
+        with os.fdopen(r, "rb") as source, os.fdopen(w, "wb", buffering=0) as sink:
+            values = []
+            stdin = StdIn(source)
+            reader = threading.Thread(target=lambda: values.append(stdin.readInt()), daemon=True)
+            sink.write(b"42\n")
+            reader.start()
+            # the writer keeps the pipe open, so the token must be read without waiting for EOF
+            reader.join(5)
+            self.assertEqual(values, [42])
+            sink.write(b"7 8")
+            sink.close()
+            self.assertEqual(stdin.readAllInts(), [7, 8])
+
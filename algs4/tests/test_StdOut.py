@@ -0,0 +1,90 @@
+import contextlib
+import io
+import threading
+import time
+import unittest
+from unittest import mock
+from array import array
+
+import sys
+sys.path.append('..')
+
+from algs4.StdOut import StdOut
+
+
+class StdOutTest(unittest.TestCase):
+
+    def tearDown(self):
+        StdOut.setUnbuffered()
+
+    def test_unbuffered(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            StdOut.print("a")
+            StdOut.println(17)
+            StdOut.println()
+        self.assertEqual(out.getvalue(), "a17\n\n")
+
+    def test_buffered(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            StdOut.setBuffered(buffer_size=8)
+            StdOut.println("abc")
+            self.assertEqual(out.getvalue(), "")
+            StdOut.println("defgh")
+            self.assertEqual(out.getvalue(), "abc\ndefgh\n")
+            StdOut.print("x")
+            StdOut.flush()
+            self.assertEqual(out.getvalue(), "abc\ndefgh\nx")
+
+    def test_buffered_threads(self):
+        class SlowStdout(io.StringIO):
+            def write(self, s):
+                time.sleep(0.001)
+                return super().write(s)
+
+        def printLines(thread):
+            for i in range(2000):
+                StdOut.printf("%d %d", (thread, i), "C")
+
+        out = SlowStdout()
+        with contextlib.redirect_stdout(out):
+            StdOut.setBuffered(buffer_size=64)
+            threads = [threading.Thread(target=printLines, args=(t,)) for t in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            StdOut.flush()
+        lines = out.getvalue().splitlines()
+        self.assertEqual(sorted(lines), sorted("{} {}".format(t, i) for t in range(4) for i in range(2000)))
+
+    def test_println_many(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            StdOut.printlnMany(range(3))
+            StdOut.printlnMany(array("d", [0.5, 1 / 3]), "%.3f")
+            StdOut.printlnMany([])
+        self.assertEqual(out.getvalue(), "0\n1\n2\n0.500\n0.333\n")
+
+    def test_format(self):
+        for format, s in (("%.6f", 1.0 / 7.0), ("%d items, %5.2f%% done", (3, 42.125)),
+                          ("%*d|%s", (4, 7, "x")), ("%(n)d", {"n": 5})):
+            self.assertEqual(StdOut.format(format, s), format % s)
+            self.assertEqual(StdOut.format(format, s, "C"), format % s)
+        self.assertRaises(TypeError, StdOut.format, "%d", (1, 2))
+
+    def test_format_locale(self):
+        with mock.patch.object(StdOut, "_decimal_point", return_value=","):
+            self.assertEqual(StdOut.format("%.2f and %d and %s", (1.5, 2, "3.5"), "xx_TEST"),
+                             "1,50 and 2 and 3.5")
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                StdOut.printf("%e", 1234.5, "xx_TEST")
+            self.assertEqual(out.getvalue(), "1,234500e+03\n")
+
+    def test_format_keeps_process_locale(self):
+        with mock.patch("locale.setlocale", side_effect=AssertionError("setlocale called")):
+            self.assertEqual(StdOut.format("%.1f", 2.5, "POSIX"), "2.5")
+            with mock.patch("locale.localeconv", return_value={"decimal_point": ","}):
+                self.assertEqual(StdOut.format("%.1f|%d", (2.5, 3), "xx_CURRENT"), "2,5|3")
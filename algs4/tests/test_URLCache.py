@@ -0,0 +1,133 @@
+import functools
+import http.server
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from In import In
+from URLCache import URLCache
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.endswith("?slow"):
+            time.sleep(1.0)
+        super().do_GET()
+
+
+class URLCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.www = os.path.join(self.tmp.name, "www")
+        os.mkdir(self.www)
+        for name, count in (("a.txt", 100), ("b.txt", 200), ("c.txt", 300)):
+            with open(os.path.join(self.www, name), "w") as f:
+                f.write(" ".join(str(i) for i in range(count)))
+        handler = functools.partial(QuietHandler, directory=self.www)
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.base = "http://127.0.0.1:{}/".format(self.server.server_address[1])
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_hits_and_revalidation(self):
+        cache = URLCache(self.cache_dir)
+        url = self.base + "a.txt"
+        inp = In(url=url, cache=cache)
+        self.assertEqual(inp.readAllInts(), list(range(100)))
+        inp.close()
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        inp = cache.open(url, stream=True)
+        self.assertEqual(inp.readInt(), 0)
+        inp.close()
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        cache.fetch(url, revalidate=False)
+        self.assertEqual(cache.hits, 2)
+
+        # a fresh cache over the same directory reuses the stored bodies
+        cache = URLCache(self.cache_dir)
+        self.assertIn(url, cache)
+        cache.fetch(url)
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_slow_download_does_not_block_hits(self):
+        cache = URLCache(self.cache_dir)
+        url = self.base + "a.txt"
+        cache.fetch(url)
+        slow = threading.Thread(target=cache.fetch, args=(self.base + "b.txt?slow",))
+        slow.start()
+        time.sleep(0.2)
+        start = time.monotonic()
+        cache.fetch(url, revalidate=False)
+        cache.fetch(url)
+        self.assertLess(time.monotonic() - start, 0.5)
+        slow.join()
+        self.assertIn(self.base + "b.txt?slow", cache)
+
+    def test_typed_arrays(self):
+        cache = URLCache(self.cache_dir)
+        url = self.base + "b.txt"
+        self.assertEqual(cache.readAllIntsArray(url), array("q", range(200)))
+        self.assertEqual(cache.readAllIntsArray(url), array("q", range(200)))
+        self.assertEqual(cache.readAllDoublesArray(url, revalidate=False)[-1], 199.0)
+        self.assertEqual((cache.parseHits, cache.parseMisses), (1, 2))
+
+    def test_lru_eviction(self):
+        sizes = {name: os.path.getsize(os.path.join(self.www, name)) for name in ("a.txt", "b.txt", "c.txt")}
+        cache = URLCache(self.cache_dir, max_bytes=sizes["b.txt"] + sizes["c.txt"])
+        cache.fetch(self.base + "a.txt")
+        cache.fetch(self.base + "b.txt")
+        cache.fetch(self.base + "a.txt")
+        cache.fetch(self.base + "c.txt")
+        self.assertIn(self.base + "a.txt", cache)
+        self.assertIn(self.base + "c.txt", cache)
+        self.assertNotIn(self.base + "b.txt", cache)
+        self.assertLessEqual(cache.size(), cache.max_bytes)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_open_body_survives_eviction(self):
+        size = os.path.getsize(os.path.join(self.www, "a.txt"))
+        cache = URLCache(self.cache_dir, max_bytes=size)
+        url = self.base + "a.txt"
+        body = cache.fetchFile(url)
+        inp = In(url=url, cache=cache, stream=True, chunk_size=16)
+        self.assertEqual(inp.readInt(), 0)
+        cache.fetch(self.base + "b.txt")
+        self.assertNotIn(url, cache)
+        with body:
+            self.assertEqual(body.read().split()[-1], b"99")
+        self.assertEqual(inp.readAllInts(), list(range(1, 100)))
+        inp.close()
+
+    def test_not_modified_keeps_index(self):
+        cache = URLCache(self.cache_dir)
+        url = self.base + "a.txt"
+        cache.fetch(url)
+        index = os.stat(os.path.join(self.cache_dir, URLCache.INDEX_NAME))
+        cache.fetch(url)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(os.stat(os.path.join(self.cache_dir, URLCache.INDEX_NAME)).st_ino, index.st_ino)
+
+    def test_clear_missing_body(self):
+        cache = URLCache(self.cache_dir)
+        cache.fetch(self.base + "a.txt")
+        os.remove(cache._path(cache._key(self.base + "a.txt"), URLCache.BODY_SUFFIX))
+        cache.clear()
+        self.assertEqual(len(cache), 0)